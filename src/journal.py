@@ -16,15 +16,38 @@ import subprocess
 from datetime import datetime 
 import re
 import sys
+import io
+import codecs
+import mmap
+import fcntl
+import contextlib
+import abc
+import sqlite3
+import struct
+import json
+import math
+import heapq
+import bisect
+import threading
+import hashlib
+import zlib
+import difflib
+import gzip
+import lzma
+import atexit
+import pickle
+from array import array
 import tty
 import time
 import termios
+import select
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
-from collections import Counter
+from collections import Counter, OrderedDict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 # Directories
 
@@ -43,6 +66,24 @@ LOGS_FILE = os.path.join(LOCAL_DIRECTORY, 'logs.txt')
 TEMPLATE_DIRECTORY = os.path.join(LOCAL_DIRECTORY, 'template.txt')
 SYNC_DIRECTORY = os.path.join(LOCAL_DIRECTORY, 'sync.txt')
 
+# The metadata index is created by the program, it sits next to the journal
+INDEX_FILE = os.path.join(LOCAL_DIRECTORY, 'index.json')
+BACKUP_MANIFEST = os.path.join(BACKUP_DIRECTORY, 'manifest.json')
+TRIGRAM_INDEX_FILE = os.path.join(LOCAL_DIRECTORY, 'trigrams.idx')
+TERM_INDEX_FILE = os.path.join(LOCAL_DIRECTORY, 'terms.idx')
+LOG_INDEX_FILE = os.path.join(LOCAL_DIRECTORY, 'logs.idx')
+
+# The packed journal, and its offset index, only used when STORAGE_BACKEND is 'pack'
+PACK_FILE = os.path.join(LOCAL_DIRECTORY, 'journal.pack')
+PACK_INDEX_FILE = os.path.join(LOCAL_DIRECTORY, 'journal.pack.idx')
+
+# The database, only used when STORAGE_BACKEND is 'sqlite'
+DATABASE_FILE = os.path.join(LOCAL_DIRECTORY, 'journal.db')
+
+# The revisions of edited entries, stored by their hash, and the log of which entry each belongs to
+HISTORY_DIRECTORY = os.path.join(LOCAL_DIRECTORY, 'history')
+HISTORY_LOG = os.path.join(HISTORY_DIRECTORY, 'history.log')
+
 '''
 This variable is very special, this should only be set to 'True', if you are syncing backup
 Data, from a program that is not this one. Hence, it will uses newlines, to create a readable
@@ -59,6 +100,13 @@ SHOW_ERRORS_NAV = False
 #This variable controls if we want to add the unfinished tag [U]
 SHOW_UNFINISHED_TAG = False
 
+# This variable controls how backups are compressed: None, 'gzip', or 'xz'
+BACKUP_COMPRESSION = None
+
+# This variable controls how entries are stored: 'tree' [a file per dream], 'pack' [journal.pack], or 'sqlite' [journal.db]
+# Use the 'pack' or 'db_import' command to copy your files in, and 'unpack' or 'db_export' to go back
+STORAGE_BACKEND = 'tree'
+
 # Color Codes
 
 class Color:
@@ -77,6 +125,29 @@ class Color:
     BROWN = '\033[38;2;139;69;19m'
     END = '\033[0m'
 
+# The colors of the values inside an entry's header fields
+HEADER_COLORS = {
+    "dream_type": {
+        "Lucid": Color.YELLOW,
+        "Vivid": Color.GREEN,
+        "Nightmare": Color.RED,
+        "Vague": Color.BROWN,
+        "Vivimax": Color.TRUE_HOT_PINK,
+    },
+    "technique": {
+        "WILD": Color.BLUE,
+        "MILD": Color.RED,
+        "SSILD": Color.CYAN,
+        "DILD": Color.YELLOW,
+        "ADA": Color.TRUE_HOT_PINK,
+    },
+    "sleep_cycle": {
+        "Regular": Color.GRAY,
+        "WBTB": Color.MAGENTA,
+        "Nap": Color.CYAN,
+    },
+}
+
 # Constants
 
 # The programs name that will be displayed
@@ -122,6 +193,86 @@ DREAM_TYPES = ['Normal', 'Lucid', 'Nightmare', 'Vivid', '']
 TECHNIQUES = ['None', 'WILD', 'DILD', 'SSILD', 'MILD']
 SLEEP_CYCLE = ['Regular', 'WBTB'] """
 
+# The file extension of each backup compression
+COMPRESSION_SUFFIXES = {
+    None: '',
+    'gzip': '.gz',
+    'xz': '.xz',
+}
+
+# The first bytes of a compressed file, used to detect compressed sync files
+COMPRESSION_MAGIC = {
+    'gzip': b'\x1f\x8b',
+    'xz': b'\xfd7zXZ\x00',
+}
+
+# The number of threads that write entries during a sync
+IMPORT_WORKERS = 8
+
+# The most entries a sync will have waiting to be written, keeps memory bounded
+IMPORT_QUEUE_LIMIT = 256
+
+# How long, in seconds, we wait for another terminal to finish writing to the database
+DATABASE_TIMEOUT = 30
+
+# The number of threads that read entries during a search, and how many entries each is given at a time
+SEARCH_WORKERS = 4
+SEARCH_CHUNK = 64
+
+# How often, in seconds, the search results are updated while a search is running
+SEARCH_REFRESH_SECONDS = 0.2
+
+# Log lines are kept in memory until we have this many bytes, or they're this many seconds old
+LOG_FLUSH_BYTES = 64 * 1024
+LOG_FLUSH_SECONDS = 5
+
+# Once logs.txt grows past this size it's moved to logs.txt.1, and we start a new one
+LOG_MAX_BYTES = 5 * 1024 * 1024
+
+# How many rotated logs we keep [logs.txt.1, logs.txt.2, ...], the oldest are removed
+LOG_BACKUP_COUNT = 3
+
+# How far apart, in bytes, the timestamps inside the log index are
+LOG_INDEX_INTERVAL = 64 * 1024
+
+# How much of logs.txt we read at a time when looking for the last events
+LOG_TAIL_CHUNK = 8 * 1024
+
+# The pattern of a log line, eg. [2024-08-29 12:00:00] | Created Dream @: ...
+LOG_LINE_PATTERN = re.compile(r"^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] \| (.*?): ")
+
+# The most memory, in bytes, the cache of rendered entries can use
+FRAME_CACHE_LIMIT = 32 * 1024 * 1024
+
+# How many entries before and after the current one are rendered in the background
+PREFETCH_DISTANCE = 3
+
+# The viewport only ever reads this many bytes ahead to find where lines start, longer lines are split
+VIEWPORT_CHUNK = 64 * 1024
+VIEWPORT_LINE_LIMIT = 512
+
+# How many line-offset indexes the viewport keeps, and the rows the navigator needs around it
+VIEWPORT_INDEX_LIMIT = 16
+VIEWPORT_MARGIN = 10
+
+# The buffer size used when writing backups
+BACKUP_BUFFER_SIZE = 1024 * 1024
+
+# A revision is compressed against the revision before it, this many times in a row at most, then it's stored whole
+HISTORY_CHAIN_DEPTH = 16
+HISTORY_COMPRESSION_LEVEL = 9
+
+# The magic bytes at the start of every stored revision
+REVISION_MAGIC = b"DVRV"
+
+# How many results a ranked search shows, and the BM25 weights it ranks with
+SEARCH_RESULTS = 20
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# The pattern of a word, for the ranked search
+TERM_PATTERN = re.compile(r"\w+")
+
 SMTP_SERVER = 'smtp.gmail.com'
 SMTP_PORT = 587
 
@@ -174,6 +325,48 @@ def create_folder(folder_directory, folder_name):
 
         return False
 
+# [✅]
+def dream_file_name(title):
+    """
+    Turns a dream title into the file name of its entry
+
+    Args:
+        title (str): The title of the dream
+
+    Returns:
+        str: The file name, without its .txt, empty if the title is empty
+    """
+
+    file_name = str(title).lower().replace(' ', '_')[0:25]
+
+    # Let's remove /'s from file names so we don't search the wrong directory
+    file_name = file_name.replace('/', '_')
+    file_name = file_name.replace('?', '_')
+    file_name = file_name.replace(':', '_')
+
+    return file_name
+
+# [✅]
+def dream_path(year, month, day, title):
+    """
+    Finds where create_dream() would store an entry, without creating anything
+
+    Args:
+        year (str/int): The year of the entry
+        month (str/int): The month of the entry, as a number
+        day (str/int): The day of the entry
+        title (str): The title of the dream
+
+    Returns:
+        str: The path of the entry, or None if the title can't be a file name
+    """
+
+    file_name = dream_file_name(title)
+    if not file_name:
+        return None
+
+    return os.path.join(JOURNAL_DIRECTORY, str(int(year)), MONTHS[int(month)], str(int(day)), f"{file_name}.txt")
+
 # [✅]
 def create_dream(year, month, day, title, content, backup):
     """
@@ -232,16 +425,11 @@ def create_dream(year, month, day, title, content, backup):
                 create_folder(month_directory, day)
 
         # Turning our dream title into a file name
-        file_name = str(title).lower().replace(' ', '_')[0:25]
+        file_name = dream_file_name(title)
 
         # If we don't have a valid, we won't be able to create our path
         if not file_name or len(file_name) <= 0:
             return (ERROR_MESSAGES[2])
-            
-        # Let's remove /'s from file names so we don't search the wrong directory
-        file_name = file_name.replace('/', '_')
-        file_name = file_name.replace('?', '_')
-        file_name = file_name.replace(':', '_')
 
         # Creating our destination path
         destination_path = os.path.join(month_directory, str(day), f"{file_name}.txt")
@@ -302,6 +490,12 @@ def create_dream(year, month, day, title, content, backup):
                 else:
                     print(f"\n{Color.RED}Unknown Command{Color.END}: [{open_file_edit}]\n")
 
+        # Moving the entry into our packed journal, if that's where entries are stored
+        commit_entry(destination_path)
+
+        # Adding this entry to our index and statistics
+        get_entry(destination_path)
+
         # Logging this dream entry creation to our logs.txt
         log("Created Dream @", destination_path)
 
@@ -392,12 +586,19 @@ def delete_entry(file_path):
         # Let's first get our current directory
         dir_path = os.path.dirname(file_path)
 
-        # Try to do os.remove with the file path
-        os.remove(file_path)
+        # Try to remove the entry from our storage
+        remove_entry(file_path)
+
+        # Removing the entry from our index and statistics
+        forget_entry(file_path)
 
         # Log the deletion
         log("Deleted Dream @", file_path)
 
+        # A packed journal, or database, has no directories to clean up
+        if entry_store() is not None:
+            return True
+
         # Check if the directory is empty
         if not os.listdir(dir_path):
 
@@ -526,602 +727,3929 @@ def date_formatter(date_unformatted, flipped, bracketBug):
     log('Malformed Date!', date_unformatted)
     return 'DirtyEntry'
 
+# The version of our packed journal's offset index, bump this if it changes
+PACK_INDEX_VERSION = 2
+
+# Every record in the packed journal starts with: magic, kind, path length, data length, ctime, mtime [ns]
+PACK_RECORD = struct.Struct("<4sBIIdq")
+PACK_MAGIC = b"DVPK"
+PACK_PUT = 0
+PACK_DELETE = 1
+
+# The stat of an entry inside a packed journal or database, it has the same fields we use from os.stat()
+EntryStat = namedtuple("EntryStat", ["st_ctime", "st_mtime_ns", "st_size"])
+
 # [✅]
-def list_files_old(directory):
+class PackStore:
     """
-    A function that searches every file within a directory
-
-    Arguments:
-        directory (str): The directory we want to search
-        
-    Returns:
-        All the files organized by date [Newest -> Oldest]
-        Sort Check: Year, Month, Day
+    A journal stored as a single append-only file. Every write, or delete,
+    of an entry is appended as a record, and a compact offset index maps
+    each entry's path to where its latest content is. Entries are read
+    through mmap, so reading one is a slice, without any copying. Entries
+    keep the paths they'd have inside the journal directory. Every terminal
+    that changes the pack holds a lock on its lock file while it does
     """
 
-    # List to store our files
-    files = []
-
-    # Loop through all the dream files
-    for root, _, file_names in os.walk(directory):
+    def __init__(self, pack_path, index_path):
+        self.pack_path = pack_path
+        self.index_path = index_path
+        # {file_path: (offset, length, ctime, mtime)}, the offset is of the entry's content
+        self.records = {}
+        # The number of bytes of the pack our records cover, and the records that were replaced
+        self.size = 0
+        self.garbage = 0
+        self.map = None
+        # The (device, inode) of the pack our records are for, compacting replaces the file
+        self.identity = None
+        self.lock = threading.RLock()
+        # The lock file, while we hold its lock, our threads share it
+        self.lock_path = pack_path + '.lock'
+        self.lock_file = None
+        self.load()
+
+    @contextlib.contextmanager
+    def exclusive(self):
+        """Holds the lock on our lock file, so no other terminal changes the pack until we're done."""
+
+        with self.lock:
+            # We already hold it, a second lock from the same process would wait on itself
+            if self.lock_file is not None:
+                yield
+                return
+
+            self.lock_file = open(self.lock_path, 'a')
+            try:
+                fcntl.flock(self.lock_file, fcntl.LOCK_EX)
+                yield
+            finally:
+                fcntl.flock(self.lock_file, fcntl.LOCK_UN)
+                self.lock_file.close()
+                self.lock_file = None
+
+    def refresh(self):
+        """
+        Reads any records another terminal appended since we last looked, or
+        starts over if it compacted the pack, we have to hold the lock
+        """
+
+        try:
+            stat = os.stat(self.pack_path)
+        except FileNotFoundError:
+            self.size, self.garbage, self.records, self.map, self.identity = 0, 0, {}, None, None
+            return
+
+        identity = (stat.st_dev, stat.st_ino)
+        if identity != self.identity or stat.st_size < self.size:
+            self.reload(identity)
+
+        if stat.st_size > self.size:
+            self.scan()
+
+    def load(self):
+        """Loads the offset index, and reads any records appended since it was saved."""
+
+        with self.exclusive():
+            self.refresh()
+
+    def reload(self, identity):
+        """Starts over from the offset index, for when the pack we knew was replaced."""
+
+        self.size, self.garbage, self.records, self.map = 0, 0, {}, None
+        self.identity = identity
+
+        try:
+            with open(self.index_path, 'rb') as file:
+                version, index_identity, size, garbage, records = pickle.load(file)
+            if version == PACK_INDEX_VERSION and index_identity == identity and size <= os.path.getsize(self.pack_path):
+                self.size, self.garbage, self.records = size, garbage, records
+
+        # A missing or corrupted index is not critical, we'll just read the whole pack
+        except Exception:
+            self.size, self.garbage, self.records = 0, 0, {}
+
+    def scan(self):
+        """
+        Reads the records after the ones our index covers, a torn record at
+        the end is cut off, we hold the lock, so nobody is still writing it
+        """
+
+        with open(self.pack_path, 'rb') as file:
+            file.seek(self.size)
+            while True:
+                header = file.read(PACK_RECORD.size)
+                if len(header) < PACK_RECORD.size:
+                    break
 
-        # Looping through all the files
-        for file_name in file_names:
+                magic, kind, path_length, length, ctime, mtime = PACK_RECORD.unpack(header)
+                path = file.read(path_length)
+                offset = file.tell()
+                if magic != PACK_MAGIC or len(path) < path_length or file.seek(length, 1) > os.path.getsize(self.pack_path):
+                    break
 
-            # If we have a .txt
-            if file_name.endswith(".txt"):
+                self.apply(path.decode('utf-8'), kind, offset, length, ctime, mtime)
+                self.size = file.tell()
 
-                # We'll want to create the path
-                file_path = os.path.join(root, file_name)
+        # Anything after our last whole record is from a write that never finished
+        if os.path.getsize(self.pack_path) > self.size:
+            log("Truncated Packed Journal @", self.size)
+            os.truncate(self.pack_path, self.size)
 
-                # Then we'll get the date from the entry.txt
-                date = extract_date_from_file(file_path)
-                
-                # Check if we have a valid date
-                date = date_formatter(date, False, True)
+        self.save()
 
-                # If our date isn't a malformed date
-                if date != 'DirtyEntry':
-                    # If the date exists, let's add it to our files
-                    if date:
-                        #files.insert(0, (date, file_path))
-                        files.append((date, file_path))
-                        # Ensures that the latest created dream comes first
-                        #files[:0] = [(date, file_path)]
-                elif date == 'DirtyEntry':
-                    #files[:0] = [('01-01-0001', file_path)]
-                    files.append(('01-01-0001', file_path))
+    def apply(self, file_path, kind, offset, length, ctime, mtime):
+        """Updates our records with a record from the pack."""
 
-    # Sort files by date in descending order (newest to oldest)
-    # It first checks year, month, and then date, and then we reverse and set
-    files.sort(key=lambda date: datetime.strptime(date[0], "%d-%m-%Y"), reverse=True)
+        if file_path in self.records:
+            self.garbage += 1
+        if kind == PACK_DELETE:
+            self.records.pop(file_path, None)
+        else:
+            self.records[file_path] = (offset, length, ctime, mtime)
+
+    def save(self):
+        """Writes the offset index, through a temporary file."""
+
+        temporary_path = self.index_path + '.tmp'
+        try:
+            with open(temporary_path, 'wb') as file:
+                pickle.dump((PACK_INDEX_VERSION, self.identity, self.size, self.garbage, self.records), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self.index_path)
+        except OSError as e:
+            log("Failed To Save Index", e)
+
+    def append(self, file_path, kind, data, ctime, mtime):
+        """Appends a record to the pack."""
+
+        path = file_path.encode('utf-8')
+        with self.exclusive():
+            # Another terminal may have appended since, so our records have to cover the whole pack first
+            self.refresh()
+
+            with open(self.pack_path, 'ab') as file:
+                # We may have just created the pack
+                if self.identity is None:
+                    stat = os.fstat(file.fileno())
+                    self.identity = (stat.st_dev, stat.st_ino)
+
+                offset = file.tell() + PACK_RECORD.size + len(path)
+                file.write(PACK_RECORD.pack(PACK_MAGIC, kind, len(path), len(data), ctime, mtime))
+                file.write(path)
+                file.write(data)
+                self.size = file.tell()
+
+            self.apply(file_path, kind, offset, len(data), ctime, mtime)
+
+            # Our map no longer covers the whole pack, slices of the old one stay valid
+            self.map = None
+
+    def put(self, file_path, data, ctime=None, mtime=None):
+        """Writes an entry, it keeps its creation time if it already exists."""
+
+        with self.exclusive():
+            self.refresh()
+            record = self.records.get(file_path)
+            if ctime is None:
+                ctime = record[2] if record else time.time()
+            self.append(file_path, PACK_PUT, data, ctime, mtime or time.time_ns())
+
+    def delete(self, file_path):
+        """Deletes an entry."""
+
+        with self.exclusive():
+            self.refresh()
+            if file_path not in self.records:
+                raise FileNotFoundError(file_path)
+            self.append(file_path, PACK_DELETE, b'', 0.0, time.time_ns())
+
+    def __contains__(self, file_path):
+        return file_path in self.records
+
+    def stat(self, file_path):
+        """The EntryStat of an entry."""
+
+        record = self.records.get(file_path)
+        if record is None:
+            raise FileNotFoundError(file_path)
+        return EntryStat(record[2], record[3], record[1])
+
+    def header(self, file_path):
+        """The pack doesn't keep headers, they're parsed from the entry."""
+        return None
+
+    def read(self, file_path, start, length):
+        """Part of an entry's content, as a slice."""
+        return self.get(file_path)[start:start + length]
+
+    def walk(self, directory):
+        """The path and EntryStat of every entry inside a directory."""
+
+        return [
+            (file_path, EntryStat(ctime, mtime, length))
+            for file_path, (_, length, ctime, mtime) in list(self.records.items())
+            if os.path.commonpath([directory, file_path]) == directory
+        ]
+
+    def ordered(self, directory):
+        """
+        The path of every entry inside a directory, and the ordinal of the day
+        in its path, our paths still follow the journal's layout [Newest -> Oldest]
+        """
+
+        entries = []
+        for file_path, stat in self.walk(directory):
+            try:
+                year, month, day, _ = os.path.relpath(file_path, directory).split(os.sep)
+                ordinal = datetime(int(year), int(MONTHS_REVERSED[month]), int(day)).toordinal()
+            except (ValueError, KeyError):
+                ordinal = DIRTY_ORDINAL
+            entries.append((ordinal, stat.st_ctime, file_path))
+
+        entries.sort(reverse=True)
+        return [(file_path, ordinal) for ordinal, _, file_path in entries]
+
+    def get(self, file_path):
+        """The content of an entry, as a memoryview of our map."""
+
+        with self.lock:
+            # A new map has to be of the pack our records are for, so we catch up with other terminals first
+            if self.map is None:
+                with self.exclusive():
+                    self.refresh()
+                    if self.size:
+                        with open(self.pack_path, 'rb') as file:
+                            self.map = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+            record = self.records.get(file_path)
+            if record is None:
+                raise FileNotFoundError(file_path)
+
+            offset, length = record[0], record[1]
+            if not length:
+                return memoryview(b'')
+            return self.map[offset:offset + length]
+
+    def compact(self):
+        """Rewrites the pack with only the latest content of every entry."""
+
+        with self.exclusive():
+            # Records other terminals appended have to be kept too
+            self.refresh()
+
+            temporary_path = self.pack_path + '.tmp'
+            records = {}
+            size = 0
+
+            with open(temporary_path, 'wb') as file:
+                for file_path, (_, length, ctime, mtime) in self.records.items():
+                    path = file_path.encode('utf-8')
+                    file.write(PACK_RECORD.pack(PACK_MAGIC, PACK_PUT, len(path), length, ctime, mtime))
+                    file.write(path)
+                    file.write(self.get(file_path))
+                    records[file_path] = (size + PACK_RECORD.size + len(path), length, ctime, mtime)
+                    size += PACK_RECORD.size + len(path) + length
+                stat = os.fstat(file.fileno())
+
+            os.replace(temporary_path, self.pack_path)
+            self.records, self.size, self.garbage, self.map = records, size, 0, None
+            self.identity = (stat.st_dev, stat.st_ino)
+            self.save()
+
+# The version of our database's layout, bump this if it changes
+DATABASE_VERSION = 1
 
-    # Return our list of files
-    # Ex: files = [('file1', '/path/to/file1.txt'),..
-    return [file_path for _, file_path in files]
+# [✅]
+class DatabaseStore:
+    """
+    A journal stored inside an SQLite database, in WAL mode, so every
+    terminal that has the vault open can read while another one writes.
+    Every entry is a row, with its parsed header in indexed columns, and the
+    values of its header fields inside a tags table, so listing, looking up
+    dates, and statistics are single queries. Entries keep the paths they'd
+    have inside the journal directory. Every thread has its own connection
+    """
 
-import os
-from datetime import datetime
+    # Our columns, in the same order as DreamEntry's slots
+    COLUMNS = "path, title, raw_date, date, ctime, mtime, size, dream_type, technique, sleep_cycle"
+
+    def __init__(self, database_path):
+        self.database_path = database_path
+        self.local = threading.local()
+
+        connection = self.connection()
+        if connection.execute("PRAGMA user_version").fetchone()[0] != DATABASE_VERSION:
+            with connection:
+                connection.executescript(f"""
+                    CREATE TABLE IF NOT EXISTS entries (
+                        path TEXT PRIMARY KEY, title TEXT, raw_date TEXT, date INTEGER,
+                        ctime REAL, mtime INTEGER, size INTEGER,
+                        dream_type TEXT, technique TEXT, sleep_cycle TEXT, content BLOB
+                    );
+                    CREATE INDEX IF NOT EXISTS entries_by_date ON entries (date DESC, ctime DESC);
+                    CREATE TABLE IF NOT EXISTS tags (path TEXT, field TEXT, value TEXT);
+                    CREATE INDEX IF NOT EXISTS tags_by_value ON tags (field, value);
+                    CREATE INDEX IF NOT EXISTS tags_by_path ON tags (path);
+                    PRAGMA user_version = {DATABASE_VERSION};
+                """)
+
+    def connection(self):
+        """This thread's connection to the database."""
+
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.database_path, timeout=DATABASE_TIMEOUT)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self.local.connection = connection
+        return connection
+
+    @staticmethod
+    def bounds(directory):
+        """The range of paths inside a directory, so we can use the primary key."""
+        return directory + os.sep, directory + chr(ord(os.sep) + 1)
+
+    def __contains__(self, file_path):
+        return self.connection().execute("SELECT 1 FROM entries WHERE path = ?", (file_path,)).fetchone() is not None
+
+    def stat(self, file_path):
+        """The EntryStat of an entry."""
+
+        row = self.connection().execute("SELECT ctime, mtime, size FROM entries WHERE path = ?", (file_path,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(file_path)
+        return EntryStat(*row)
+
+    def header(self, file_path):
+        """The parsed header of an entry, straight from its columns."""
+
+        row = self.connection().execute(f"SELECT {self.COLUMNS} FROM entries WHERE path = ?", (file_path,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(file_path)
+        return DreamEntry(*row)
+
+    def get(self, file_path):
+        """The content of an entry, as bytes."""
+
+        row = self.connection().execute("SELECT content FROM entries WHERE path = ?", (file_path,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(file_path)
+        return row[0]
+
+    def read(self, file_path, start, length):
+        """Part of an entry's content, only that part is read from the database."""
+
+        row = self.connection().execute(
+            "SELECT substr(content, ?, ?) FROM entries WHERE path = ?", (start + 1, length, file_path)
+        ).fetchone()
+        if row is None:
+            raise FileNotFoundError(file_path)
+        return row[0] or b''
+
+    def put(self, file_path, data, ctime=None, mtime=None):
+        """Writes an entry, along with its parsed header, it keeps its creation time if it already exists."""
+
+        data = bytes(data)
+        entry = DreamEntry(file_path, size=len(data), mtime=mtime or time.time_ns())
+        parse_entry_header(entry, split_header_lines(data[:HEADER_LIMIT]))
+
+        connection = self.connection()
+        with connection:
+            if ctime is None:
+                row = connection.execute("SELECT ctime FROM entries WHERE path = ?", (file_path,)).fetchone()
+                ctime = row[0] if row else time.time()
+            entry.ctime = ctime
+
+            connection.execute(
+                f"INSERT OR REPLACE INTO entries ({self.COLUMNS}, content) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (*(getattr(entry, slot) for slot in DreamEntry.__slots__), data)
+            )
+            connection.execute("DELETE FROM tags WHERE path = ?", (file_path,))
+            connection.executemany(
+                "INSERT INTO tags (path, field, value) VALUES (?, ?, ?)",
+                [(file_path, field, value) for field in HEADER_FIELDS for value in getattr(entry, field).split(", ")]
+            )
+
+    def delete(self, file_path):
+        """Deletes an entry."""
+
+        connection = self.connection()
+        with connection:
+            if not connection.execute("DELETE FROM entries WHERE path = ?", (file_path,)).rowcount:
+                raise FileNotFoundError(file_path)
+            connection.execute("DELETE FROM tags WHERE path = ?", (file_path,))
+
+    def walk(self, directory):
+        """The path and EntryStat of every entry inside a directory."""
+
+        return [
+            (file_path, EntryStat(ctime, mtime, size))
+            for file_path, ctime, mtime, size in self.connection().execute(
+                "SELECT path, ctime, mtime, size FROM entries WHERE path >= ? AND path < ?", self.bounds(directory)
+            )
+        ]
+
+    def ordered(self, directory):
+        """The path and date ordinal of every entry inside a directory [Newest -> Oldest]."""
+
+        return self.connection().execute(
+            "SELECT path, date FROM entries WHERE path >= ? AND path < ? ORDER BY date DESC, ctime DESC",
+            self.bounds(directory)
+        ).fetchall()
+
+    def entries(self, directory):
+        """The DreamEntry of every entry inside a directory [Newest -> Oldest]."""
+
+        return [
+            DreamEntry(*row) for row in self.connection().execute(
+                f"SELECT {self.COLUMNS} FROM entries WHERE path >= ? AND path < ? ORDER BY date DESC, ctime DESC",
+                self.bounds(directory)
+            )
+        ]
+
+    def statistics(self, directory):
+        """The number of entries inside a directory, and the counts of every header field value."""
+
+        connection = self.connection()
+        count = connection.execute("SELECT COUNT(*) FROM entries WHERE path >= ? AND path < ?", self.bounds(directory)).fetchone()[0]
+
+        counts = {field: Counter() for field in HEADER_FIELDS}
+        for field, value, amount in connection.execute(
+            "SELECT field, value, COUNT(*) FROM tags WHERE path >= ? AND path < ? GROUP BY field, value", self.bounds(directory)
+        ):
+            counts[field][value] = amount
+
+        return count, counts
+
+# The storage backend we're using, loaded the first time we use it
+_entry_store = None
 
-def list_files(directory):
+# [✅]
+def entry_store():
     """
-    A function that searches every file within a directory
+    Gets the store our entries are kept in, based on STORAGE_BACKEND
 
-    Arguments:
-        directory (str): The directory we want to search
-        
     Returns:
-        All the files organized by date [Newest -> Oldest]
-        Sort Check: Year, Month, Day, and creation time
+        A PackStore or DatabaseStore, or None if entries are stored as files
     """
 
-    # List to store our files
-    files = []
+    global _entry_store
 
-    # Loop through all the dream files
-    for root, _, file_names in os.walk(directory):
-        # Looping through all the files
-        for file_name in file_names:
-            # If we have a .txt
-            if file_name.endswith(".txt"):
-                # Create the path
-                file_path = os.path.join(root, file_name)
-
-                # Get the date from the entry.txt
-                date = extract_date_from_file(file_path)
-                
-                # Format the date and check for validity
-                date = date_formatter(date, False, True)
-
-                # If date is valid
-                if date != 'DirtyEntry':
-                    if date:
-                        # Append the date and creation time
-                        creation_time = os.path.getctime(file_path)
-                        files.append((date, creation_time, file_path))
-                else:
-                    # If date is malformed
-                    creation_time = os.path.getctime(file_path)
-                    files.append(('01-01-0001', creation_time, file_path))
+    if STORAGE_BACKEND == 'pack':
+        if not isinstance(_entry_store, PackStore) or _entry_store.pack_path != PACK_FILE:
+            _entry_store = PackStore(PACK_FILE, PACK_INDEX_FILE)
+        return _entry_store
 
-    # Sort by date (newest to oldest), and then by creation time (newest to oldest)
-    files.sort(
-        key=lambda entry: (datetime.strptime(entry[0], "%d-%m-%Y"), entry[1]),
-        reverse=True
-    )
+    if STORAGE_BACKEND == 'sqlite':
+        if not isinstance(_entry_store, DatabaseStore) or _entry_store.database_path != DATABASE_FILE:
+            _entry_store = DatabaseStore(DATABASE_FILE)
+        return _entry_store
 
-    # Return the list of file paths, sorted by date and creation time
-    return [file_path for _, _, file_path in files]
+    return None
 
 # [✅]
-def extract_date_from_file(file_path):
-    """
-    A function that extracts the dream date from a file
-
-    Arguments:
-        file_path (str): The files path, so that we can read it
-        
-    Returns:
-        The date, if we have it inside the file, othewise return 'DirtyEntry',
-        so that we don't accidentally crash the program
-    """
-    try:
-        # Pattern to match date after inital '|'
-        # Eg. [ (Title) | (X) ]
-        date_pattern = r"\[.*\| (.*) \]" 
+def stat_entry(file_path):
+    """The stat of an entry, from our storage backend."""
 
-        # We'll then open that file in read mode
-        with open(file_path, 'r') as file:
-            
-            # Read the content
-            content = file.read()
-
-            # Check if we have the date pattern inside the content
-            match = re.search(date_pattern, content)
-            if match:
-                # Let's return the date
-                return match.group(1)
-            else:
-                # Throw an error if the date is missing, and log it
-                log("Date Missing In", file_path)
-                print("───────────────────────────────────────────────────────────────────────")
-                print(f"{Color.RED}Critical Error! Date Missing In: {file_path}\n1. Set Title To: [ (TITLE) | (DATE) ]\n3. Do Not Forget Spaces!\n4. Use 'r' Command To Refresh\n5. Error Should Be Resolved{Color.END}")
-                return 'DirtyEntry'
-            
-    # We've caught an error
-    except Exception as e:
-        # Display an error, log the error, and return 'DirtyEntry'
-        log("Date Missing In", file_path)
-        print("───────────────────────────────────────────────────────────────────────")
-        print(f"{Color.RED}Critical Error! Date Missing In: {file_path}\n1. Set Title To: [ (TITLE) | (DATE) ]\n3. Do Not Forget Spaces!\n4. Use 'r' Command To Refresh\n5. Error Should Be Resolved{Color.END}")
-        return 'DirtyEntry'
+    store = entry_store()
+    return store.stat(file_path) if store is not None else os.stat(file_path)
 
 # [✅]
-def display_dream(file_path, openEditor, returnDate, searchWord):
-    """
-    A function that displays a dream to the console
+def entry_exists(file_path):
+    """If an entry is in our storage backend."""
 
-    Arguments:
-        file_path (str): The files path, so that we can read it
-        openEditor (str): If we want to edit the file or not
-        returnDate (bool): If we want to only return the date
-        searchWord (str): A word we want to highlight (search function)
-        
-    Returns:
-        True is everything was displayed correctly, False if an error occured
-    """
+    store = entry_store()
+    return file_path in store if store is not None else os.path.exists(file_path)
 
-    try:
-        # Open the file with reader
-        with open(file_path, 'r') as file:
-
-            # If editor is False, read it to the console only
-            if openEditor == False:
-                # We must check if it has a valid date, we'll display the error to the user, so that they can fix it
-                if date_formatter(extract_date_from_file(file_path), False, True) == 'DirtyEntry':
-                    print(f"{Color.RED}Malformed Date!:\n1. Change Date To A Valid: [Day Month, Year]\n2. Use 'r' Command To Refresh\n3. Error Should Be Resolved{Color.END}")
-                    print("───────────────────────────────────────────────────────────────────────")
-                
-                # If we only want the date, return it [formatting]
-                if returnDate:
-                    return extract_date_from_file(file_path)
-
-                # Otherwise, normally print to the screen
-                lines = file.readlines()
-                for i, line in enumerate(lines):
-                    if i == 0 and "[U]" in line:
-                        line = line.replace("[U]", f"{Color.RED}[U]{Color.END}")
-
-                    # Color the dream types
-                    if i == 2 and "Lucid" in line:
-                        line = line.replace("Lucid", f"{Color.YELLOW}Lucid{Color.END}")
-                    if i == 2 and "Vivid" in line:
-                        line = line.replace("Vivid", f"{Color.GREEN}Vivid{Color.END}")
-                    if i == 2 and "Nightmare" in line:
-                        line = line.replace("Nightmare", f"{Color.RED}Nightmare{Color.END}")
-                    if i == 2 and "Vague" in line:
-                        line = line.replace("Vague", f"{Color.BROWN}Vague{Color.END}")
-                    if i == 2 and "Vivimax" in line:
-                        line = line.replace("Vivimax", f"{Color.TRUE_HOT_PINK}Vivimax{Color.END}")
-                    
-                    # Color the dream techniques
-                    if i == 3 and "WILD" in line:
-                        line = line.replace("WILD", f"{Color.BLUE}WILD{Color.END}")
-                    if i == 3 and "MILD" in line:
-                        line = line.replace("MILD", f"{Color.RED}MILD{Color.END}")
-                    if i == 3 and "SSILD" in line:
-                        line = line.replace("SSILD", f"{Color.CYAN}SSILD{Color.END}")
-                    if i == 3 and "DILD" in line:
-                        line = line.replace("DILD", f"{Color.YELLOW}DILD{Color.END}")
-                    if i == 3 and "ADA" in line:
-                        line = line.replace("ADA", f"{Color.TRUE_HOT_PINK}ADA{Color.END}")
-                    
-                    # Color the sleep cycles
-                    if i == 4 and "Regular" in line:
-                        line = line.replace("Regular", f"{Color.GRAY}Regular{Color.END}")
-                    if i == 4 and "WBTB" in line:
-                        line = line.replace("WBTB", f"{Color.MAGENTA}WBTB{Color.END}")
-                    if i == 4 and "Nap" in line:
-                        line = line.replace("Nap", f"{Color.CYAN}Nap{Color.END}")
-
-                    # Color the N/A's
-                    if i == 2 or i == 3 or i == 4 and "N/A" in line:
-                        line = line.replace("N/A", f"{Color.RED}N/A{Color.END}")
-
-                    if "[EMPTY]" in line:
-                        line = line.replace("[EMPTY]", f"{Color.RED}[EMPTY]{Color.END}")
-
-                    if searchWord:
-                        pattern = re.compile(re.escape(searchWord), re.IGNORECASE)
-                        line = pattern.sub(f"{Color.GREEN}{Color.UNDERLINE}{searchWord}{Color.END}", line)
-
-                    # Print each line
-                    print(line.strip())
-                return True
-            
-            # If editor is True, let's open it with our text editor
-            else:
-                subprocess.run(TEXT_EDITOR + [file_path])
-                return True
+# [✅]
+def read_entry(file_path):
+    """The content of an entry as bytes, a slice of the packed journal if that's our backend."""
 
-    # If an error occurs print it, log it, and then return False
-    except Exception as e:
-        log("Unknown Error", e)
-        print(f"{Color.RED}Error! {e}{Color.END}")
-        return False
+    store = entry_store()
+    if store is not None:
+        return store.get(file_path)
 
-# [X]
-def getch():
-    fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
-    try:
-        tty.setraw(sys.stdin.fileno())
-        ch = sys.stdin.read(1)
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-    return ch
+    with open(file_path, 'rb') as file:
+        return file.read()
 
 # [✅]
-def navigate():
-    """
-    A function that can navigate through every dream inside our journal,
-    using CLI, and certain commands the user can use. Moreover, the 
-    navigation is wrapped, meaning that if we are at the end, we'll wrap
-    to the start again, hence we cannot crash this function.
+def read_entry_range(file_path, start, length):
+    """Reads part of an entry's content as bytes, without reading the rest of it."""
 
-    Commands:
-        [n]ext: Go to the next file
-        [p]revious: Go to the previous file
-        [e]dit: Edit the current file
-        [d]elete: Delete the current file
-        [r]efresh: Refresh the current file
-        [i]ndex: Change index
-        [c]lear logs: Clear local logs
-        [q]uit: Quit navigation
+    store = entry_store()
+    if store is not None:
+        return store.read(file_path, start, length)
 
-    Returns:
-        Nothing
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        return file.read(length)
+
+# [✅]
+class EntryReader:
+    """
+    Reads a stored entry as text, straight from the slice our store gives
+    us, for a packed journal that's the mmap itself, so an entry is never
+    copied as bytes, only decoded as it's read. It supports what we use
+    from text files: read(), readline(), and iterating over lines, with
+    newlines translated the same way open() does
     """
 
-    # A variable to store all our local error logs
-    error_log = []
+    NEWLINE_PATTERN = re.compile(rb"\r\n?|\n")
 
-    # A file that stores all of our files inside of our journal directory
-    #dream_files = list_files(JOURNAL_DIRECTORY)
-    dream_files = list_files(JOURNAL_DIRECTORY)[::-1]
+    def __init__(self, view):
+        self.view = memoryview(view)
+        self.position = 0
+        self.decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        # A '\r' at the end of a read, it could be the start of a '\r\n'
+        self.pending = ''
 
-    # There are no files, let's display that we don't have any entries
-    if not dream_files:
-        print(f"\n{Color.YELLOW}No Dream Entries Found!{Color.END}\n")
-        return
+    def __enter__(self):
+        return self
 
-    # Index to keep track of what file we are looking at currently
-    #index = 0
-    index = len(dream_files) - 1
+    def __exit__(self, kind, error, traceback):
+        self.view.release()
+        return False
 
-    # Main display loop
-    while True:
+    def take(self, end):
+        """Decodes the bytes up to end, a character split between reads is kept for the next one."""
 
-        # Let's first clear the terminal
-        clear_terminal()
+        start, self.position = self.position, end
+        return self.decoder.decode(self.view[start:end], final=end == len(self.view))
 
-        # Let's check if we have a negative index
-        if index < 0:
-            # Set it to zero, [avoiding crashes]
-            #index = 0
-            index = len(dream_files) - 1
+    def read(self, size=-1):
+        """Reads the rest of the entry, or about size more characters [UTF-8 is at most 4 bytes each]."""
 
-        # Otherwise, if it's greater than the amount of files we have, remove 1, which wraps around to the start
-        elif index >= len(dream_files):
-            index = 0
+        text, self.pending = self.pending, ''
 
-        #elif index >= len(dream_files):
-        #   index = len(dream_files) - 1
+        if size is None or size < 0:
+            text += self.take(len(self.view))
 
-        # Dream Count Display
-        print(f"{Color.BLUE}Dream: [{index + 1}/{len(dream_files)}]{Color.END} | {Color.BLUE}{display_dream(dream_files[index], False, True, False)}{Color.END} | @ {dream_files[index]}\n\n───────────────────────────────────────────────────────────────────────")
-        
-        # Display the latest dream
-        display_attempt = display_dream(dream_files[index], False, False, False)
-        if not display_attempt:
-            error_log.append((f"\n{Color.RED}Failed To Display Entry!{Color.END}: [{dream_files[index]}]\n"))
-
-        # Displaying errors in the local log
-        if SHOW_ERRORS_NAV:
-            for item in error_log:
-                print(item)
-    
-        # Command prompt
-        print("───────────────────────────────────────────────────────────────────────\n")
-        print(f"{Color.GREEN}Commands: [n]ext, [p]revious, [e]dit, [d]elete, [s]earch, [i]ndex, [c]lear logs, [q]uit{Color.END}")
-        
-        # Read single character input without requiring Enter
-        command = getch().lower()
+        # Reading until we have a character, a '\r' on its own has to wait for the next one
+        while self.position < len(self.view):
+            text += self.take(min(self.position + max(size, 1), len(self.view)))
+            if text.endswith('\r') and self.position < len(self.view):
+                if len(text) == 1:
+                    continue
+                text, self.pending = text[:-1], '\r'
+            if text:
+                break
 
-        # If the user wants to go next
-        if command == 'n':
-            # Increment the index, % to make sure we're not over the amount of files we have
-            index = (index - 1) % len(dream_files)
-        elif command == 'p':
-            # Decrement the index, % to make sure we can wrap            
-            index = (index + 1) % len(dream_files)
-        elif command == 'e':
-            # Display our dream, with editing on
-            display_dream(dream_files[index], True, False, False) 
-        elif command == 'd':
-            # Delete a dream entry
-            if CAN_DELETE == True:
-                delete_entry(dream_files[index])
+        return text.replace('\r\n', '\n').replace('\r', '\n')
 
-                # Update list of files after deletion
-                dream_files = list_files(JOURNAL_DIRECTORY)[::-1]
+    def readline(self):
+        """Reads a line, along with its newline."""
 
-                # If there are no dream files, throw an error
-                if not dream_files:
-                    print(f"\n{Color.YELLOW}No Dream Entries Found!{Color.END}\n")
-                    break
-                # Otherwise, if the length is greater, decrement it
-                elif index >= len(dream_files):
-                    index = 0
-            else:
-                error_log.append((f"{Color.RED}Deleting Dreams is Disabled\nUse 'toggle_del' command to change.{Color.END}"))
+        if self.pending:
+            # A '\r' held back by read() is a line on its own, unless a '\n' follows it
+            self.pending = ''
+            if self.view[self.position:self.position + 1] == b'\n':
+                self.position += 1
+            return '\n'
 
-        # If the command is to search, we'll start searching
-        elif command == 's':                
-            # Prompt the user for a search keyword
-            search_keyword = input("Search keyword: ").strip()
+        match = self.NEWLINE_PATTERN.search(self.view, self.position)
+        text = self.take(match.end() if match else len(self.view))
+        return text.replace('\r\n', '\n').replace('\r', '\n')
 
-            # Gather a list of files that match the search phrase along with their original index
-            matching_files = []
-            for index, file in enumerate(dream_files):
-                with open(os.path.join(JOURNAL_DIRECTORY, file), 'r') as f:
-                    content = f.read().lower()
-                    if search_keyword.lower() in content:
-                        matching_files.append((file, index))  # Store both the file and its original index
+    def __iter__(self):
+        while True:
+            line = self.readline()
+            if not line:
+                return
+            yield line
 
-            matching_files = matching_files[::-1]
+# [✅]
+def open_entry(file_path):
+    """Opens an entry for reading as text, from our storage backend."""
 
-            # If no matches found, log an error
-            if not matching_files:
-                print(f"{Color.RED}No Matches For: {search_keyword}{Color.END}")
-                time.sleep(1)
+    store = entry_store()
+    if store is not None:
+        return EntryReader(store.get(file_path))
 
-            # New search-based navigation
-            search_index = 0
+    return open(file_path, 'r', errors='replace')
 
-            while matching_files:
-                # Clear the terminal
-                clear_terminal()
+# [✅]
+def write_entry(file_path, data):
+    """Writes the content of an entry as bytes, to our storage backend."""
 
-                # Display the search results and current file
-                print(f"{Color.BLUE}Search Results: [{search_index + 1}/{len(matching_files)}]{Color.END} | {Color.BLUE}{display_dream(matching_files[search_index][0], False, True, False)}{Color.END} | {Color.GREEN}Index: {matching_files[search_index][1]+1}{Color.END} | @ {matching_files[search_index][0]}\n\n───────────────────────────────────────────────────────────────────────")
-                
-                # Show the content of the currently selected dream
-                display_attempt = display_dream(matching_files[search_index][0], False, False, search_keyword)
-                if not display_attempt:
-                    error_log.append((f"\n{Color.RED}Failed To Display Entry!{Color.END}: [{matching_files[search_index]}]\n"))
+    store = entry_store()
+    if store is not None:
+        store.put(file_path, data)
+        return
 
-                # Displaying errors in the local log
-                if SHOW_ERRORS_NAV:
-                    for item in error_log:
-                        print(item)
+    with open(file_path, 'wb') as file:
+        file.write(data)
 
-                # Command prompt for the search navigation
-                print("───────────────────────────────────────────────────────────────────────\n")
-                print(f"{Color.GREEN}Commands: [n]ext, [p]revious, [b]ack{Color.END}")
+# [✅]
+def remove_entry(file_path):
+    """Removes an entry from our storage backend."""
 
-                # Read single character input
-                search_command = getch().lower()
+    store = entry_store()
+    if store is not None:
+        store.delete(file_path)
+    else:
+        os.remove(file_path)
 
-                if search_command == 'n':
-                    # Move to the next matching file
-                    search_index = (search_index + 1) % len(matching_files)
-                elif search_command == 'p':
-                    # Move to the previous matching file
-                    search_index = (search_index - 1) % len(matching_files)
-                elif search_command == 'e':
-                    # Edit the current file
-                    print("Disabled...")
-                    # display_dream(matching_files[search_index], True, False, False)
-                elif search_command == 'b':
-                    # Return to the main navigation
-                    break
-                else:
-                    # Invalid command handling
-                    error_log.append((f"\n{Color.RED}Unknown Command{Color.END}: [{search_command}]\n"))
+# [✅]
+def checkout_entry(file_path):
+    """
+    Writes an entry from our store out to its file, so it can be opened
+    with our text editor, this does nothing if entries are files
+    """
 
-        # If the command is to index to a certain dream location
-        elif command == 'i':
-            # Getting our index location we want to navigate to
-            index_location = input("Enter an index location: ")
-            try:
-                index_location = int(index_location)
-                # Check if index_location is within the valid range
-                if 0 <= index_location <= len(dream_files):
-                    # Set our index to the proper location, subtract 1, indexes start at 0
-                    index = index_location - 1
-                else:
-                    # Handle invalid index input
-                    error_log.append((f"\n{Color.RED}Invalid Index!{Color.END}: [{index_location}]\n"))
-            except Exception as e:
-                error_log.append((f"\n{Color.RED}Invalid Index!{Color.END}: [{index_location}]\n"))
-        # If our command is to clear our local logs, set the error_logs to empty
-        elif command == 'c':
-            error_log = []
-        # If the command is to quit, break the navigation loop
-        elif command == 'q':
-            # Quit the loop
-            break
-        # Otherwise, we have an invalid error, display this
-        else:
-            # Display we have an invalid command
-            error_log.append((f"\n{Color.RED}Unknown Command{Color.END}: [{command}]\n"))
+    store = entry_store()
+    if store is not None:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'wb') as file:
+            file.write(store.get(file_path))
 
 # [✅]
-def sync():
+def commit_entry(file_path):
     """
-    Sync loads a .txt fiFe and reads all the contents. It then
-    turns the text inside the body into a dream journal. There is
-    a specific format to be followed, and this format is used in 'backup()'
+    Moves an entry that was written, or edited, as a file into our store,
+    this does nothing if entries are files
+    """
+
+    store = entry_store()
+    if store is not None:
+        with open(file_path, 'rb') as file:
+            data = file.read()
+
+        # Only unchanged entries are skipped, so we don't store copies
+        if file_path not in store or bytes(store.get(file_path)) != data:
+            store.put(file_path, data)
+        os.remove(file_path)
+
+        # The working file's directories aren't needed either, unless something else is in them
+        directory = os.path.dirname(file_path)
+        while directory.startswith(JOURNAL_DIRECTORY + os.sep):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                break
+            directory = os.path.dirname(directory)
+
+# [✅]
+def walk_entries(directory):
+    """
+    Finds every entry inside a directory
+
+    Arguments:
+        directory (str): The journal directory
+
+    Yields:
+        The file path, and the stat, of every entry
+    """
+
+    store = entry_store()
+    if store is not None:
+        yield from store.walk(directory)
+        return
+
+    # Directories we still need to look through, scandir gives us the stats for free
+    pending = [directory]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as iterator:
+                for item in iterator:
+                    if item.is_dir():
+                        pending.append(item.path)
+                    elif item.name.endswith(".txt"):
+                        yield item.path, item.stat()
+        except OSError as e:
+            log("Failed To Read Directory", e)
+
+# [✅]
+def import_tree(store, location):
+    """
+    Copies every entry inside our journal directory into a store, the files
+    are left where they are
+
+    Arguments:
+        store (PackStore | DatabaseStore): The store we're copying into
+        location (str): Where the store is, for our messages
+    """
+
+    count = 0
+
+    for root, _, file_names in os.walk(JOURNAL_DIRECTORY):
+        for file_name in file_names:
+            if file_name.endswith(".txt"):
+                file_path = os.path.join(root, file_name)
+                stat = os.stat(file_path)
+                with open(file_path, 'rb') as file:
+                    store.put(file_path, file.read(), stat.st_ctime, stat.st_mtime_ns)
+                count += 1
+
+    log("Imported Journal @", location)
+    print(f"\n{Color.GREEN}Imported {count} Dreams @ {location}{Color.END}\n")
+
+# [✅]
+def export_tree(store):
+    """
+    Exports every entry inside a store back to its file inside our journal
+    directory, byte for byte, along with its modification time. Creation
+    times can't be set, so the entries are written oldest first, that way
+    the new ones keep the order of entries from the same day
+
+    Arguments:
+        store (PackStore | DatabaseStore): The store we're exporting
+    """
+
+    entries = sorted(store.walk(JOURNAL_DIRECTORY), key=lambda item: item[1].st_ctime)
+
+    for file_path, stat in entries:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'wb') as file:
+            file.write(store.get(file_path))
+        os.utime(file_path, ns=(stat.st_mtime_ns, stat.st_mtime_ns))
+
+    log("Exported Journal @", JOURNAL_DIRECTORY)
+    print(f"\n{Color.GREEN}Exported {len(entries)} Dreams @ {JOURNAL_DIRECTORY}{Color.END}\n")
+
+# [✅]
+def pack_journal():
+    """
+    Copies every entry inside our journal directory into the packed journal.
+    Set STORAGE_BACKEND to 'pack' to use it
+    """
+
+    global _entry_store
+
+    # Packing into the pack we're using, so its offsets stay up to date when it's compacted
+    store = entry_store()
+    if not isinstance(store, PackStore):
+        store = PackStore(PACK_FILE, PACK_INDEX_FILE)
+
+    import_tree(store, PACK_FILE)
+    store.compact()
+
+    # Any other pack we loaded has the offsets from before compacting
+    if _entry_store is not store:
+        _entry_store = None
+
+# [✅]
+def unpack_journal():
+    """Exports every entry inside the packed journal back to our journal directory."""
+
+    if not os.path.exists(PACK_FILE):
+        print(f"\n{Color.RED}No Packed Journal @ {PACK_FILE}{Color.END}\n")
+        return
+
+    export_tree(PackStore(PACK_FILE, PACK_INDEX_FILE))
+
+# [✅]
+def database_import():
+    """
+    Copies every entry inside our journal directory into the database.
+    Set STORAGE_BACKEND to 'sqlite' to use it
+    """
+
+    import_tree(DatabaseStore(DATABASE_FILE), DATABASE_FILE)
+
+# [✅]
+def database_export():
+    """Exports every entry inside the database back to our journal directory."""
+
+    if not os.path.exists(DATABASE_FILE):
+        print(f"\n{Color.RED}No Database @ {DATABASE_FILE}{Color.END}\n")
+        return
+
+    export_tree(DatabaseStore(DATABASE_FILE))
+
+# The number of lines that make up an entry's header [title/date, divider, and the three fields]
+HEADER_LINES = 5
+
+# How much of an entry we read at a time when looking for the header
+HEADER_CHUNK = 1024
+
+# The most we'll ever read for a header, so a broken entry can't make us read the whole file
+HEADER_LIMIT = 4096
+
+# Patterns to match the title and the date inside the first line
+# Eg. [ (Title) | (X) ]
+TITLE_PATTERN = re.compile(r"\[ \((.*?)\) \|")
+DATE_PATTERN = re.compile(r"\[.*\| (.*) \]")
+
+# The date ordinal given to entries with a malformed date, it's lower than any
+# real date's ordinal, so dirty entries are always listed last
+DIRTY_ORDINAL = 0
+
+# The header fields, mapped to the line they're on and the label create_dream() writes
+HEADER_FIELDS = {
+    "dream_type": (2, "Dream Type:"),
+    "technique": (3, "Technique:"),
+    "sleep_cycle": (4, "Sleep Cycle:"),
+}
+
+# [✅]
+class DreamEntry:
+    """
+    The parsed header of a dream entry, along with the file information
+    we need to order it. This is shared by the listing, navigation,
+    statistics and backups, so an entry only ever has to be parsed once
+    """
+
+    __slots__ = (
+        'path', 'title', 'raw_date', 'date', 'ctime', 'mtime', 'size',
+        'dream_type', 'technique', 'sleep_cycle',
+    )
+
+    def __init__(self, path, title='', raw_date='DirtyEntry', date=DIRTY_ORDINAL, ctime=0.0, mtime=0, size=0,
+                 dream_type='', technique='', sleep_cycle=''):
+        self.path = path
+        self.title = title
+        # The date as written in the entry, eg. (29 August, 2024)
+        self.raw_date = raw_date
+        # The date as a proleptic Gregorian ordinal, or DIRTY_ORDINAL
+        self.date = date
+        self.ctime = ctime
+        self.mtime = mtime
+        self.size = size
+        self.dream_type = dream_type
+        self.technique = technique
+        self.sleep_cycle = sleep_cycle
+
+    def to_record(self):
+        """Turns the entry into a list we can store in the index, without its path."""
+        return [getattr(self, slot) for slot in self.__slots__[1:]]
+
+    @classmethod
+    def from_record(cls, path, record):
+        """Rebuilds an entry from a list stored in the index."""
+        return cls(path, *record)
+
+# [✅]
+def date_ordinal(raw_date):
+    """
+    Turns an entry's date into an integer we can sort with
+
+    Arguments:
+        raw_date (str): The date as written in the entry, eg. (29 August, 2024)
+
+    Returns:
+        The date's ordinal [datetime.toordinal()], or DIRTY_ORDINAL if it's malformed
+    """
+
+    date = date_formatter(raw_date, False, True)
+
+    try:
+        day, month, year = date.split('-')
+        return datetime(int(year), int(month), int(day)).toordinal()
+
+    # Malformed dates, or dates that don't exist, eg. (31 February, 2024)
+    except ValueError:
+        return DIRTY_ORDINAL
+
+# [✅]
+def report_missing_date(file_path):
+    """
+    Displays and logs that an entry is missing its date
+
+    Arguments:
+        file_path (str): The location of the broken entry
+    """
+
+    log("Date Missing In", file_path)
+    print("───────────────────────────────────────────────────────────────────────")
+    print(f"{Color.RED}Critical Error! Date Missing In: {file_path}\n1. Set Title To: [ (TITLE) | (DATE) ]\n3. Do Not Forget Spaces!\n4. Use 'r' Command To Refresh\n5. Error Should Be Resolved{Color.END}")
+
+# [✅]
+def read_header_lines(file_path):
+    """
+    Reads only the header lines of an entry, we read small chunks until we
+    have all of them, so we never touch the body of the dream
+
+    Arguments:
+        file_path (str): The location of the entry
+
+    Returns:
+        A list of up to HEADER_LINES lines, without their newlines
+    """
+
+    # A stored entry's header is read as a single slice
+    store = entry_store()
+    if store is not None:
+        return split_header_lines(bytes(store.read(file_path, 0, HEADER_LIMIT)))
+
+    head = b''
+
+    # Unbuffered, so we only read the bytes we've asked for
+    with open(file_path, 'rb', buffering=0) as file:
+        while head.count(b'\n') < HEADER_LINES and len(head) < HEADER_LIMIT:
+            chunk = file.read(HEADER_CHUNK)
+            if not chunk:
+                break
+            head += chunk
+
+    return split_header_lines(head)
+
+# [✅]
+def split_header_lines(head):
+    """Splits the start of an entry into its header lines, without their newlines."""
+    return [line.decode('utf-8', 'replace').rstrip('\r') for line in head.split(b'\n')[:HEADER_LINES]]
+
+# [✅]
+def read_entry_header(file_path, stat=None):
+    """
+    Parses the header of a dream entry into a DreamEntry
+
+    Arguments:
+        file_path (str): The location of the entry
+        stat (os.stat_result): The entry's stat, if we already have it
+
+    Returns:
+        A DreamEntry, its date will be DIRTY_ORDINAL if the header is broken
+    """
+
+    entry = DreamEntry(file_path)
+
+    # A database already has the header parsed
+    store = entry_store()
+    if store is not None and stat is None:
+        try:
+            header = store.header(file_path)
+            if header is not None:
+                return header
+        except OSError:
+            report_missing_date(file_path)
+            return entry
+
+    try:
+        if stat is None:
+            stat = stat_entry(file_path)
+
+        entry.ctime = stat.st_ctime
+        entry.mtime = stat.st_mtime_ns
+        entry.size = stat.st_size
+
+        lines = read_header_lines(file_path)
+
+    # We couldn't read the entry, it's treated as a dirty entry
+    except OSError as e:
+        report_missing_date(file_path)
+        return entry
+
+    parse_entry_header(entry, lines)
+    return entry
+
+# [✅]
+def parse_entry_header(entry, lines):
+    """
+    Fills in a DreamEntry from the header lines of its entry
+
+    Arguments:
+        entry (DreamEntry): The entry we're filling in
+        lines (list): The entry's header lines, from split_header_lines()
+    """
+
+    # Getting the title and the date from the first line
+    match = TITLE_PATTERN.search(lines[0])
+    if match:
+        entry.title = match.group(1)
+
+    match = DATE_PATTERN.search(lines[0])
+    if match:
+        entry.raw_date = match.group(1)
+        entry.date = date_ordinal(entry.raw_date)
+    else:
+        report_missing_date(entry.path)
+
+    # Getting our header fields from their lines
+    for field, (line_number, label) in HEADER_FIELDS.items():
+        if line_number < len(lines) and label in lines[line_number]:
+            setattr(entry, field, lines[line_number].split(label, 1)[1].strip())
+
+# The version of our index layout, bump this if the records change
+INDEX_VERSION = 4
+
+# The in-memory copy of our index, so we only read index.json once per run
+_index_cache = None
+
+# [✅]
+def count_entry(index, entry, amount):
+    """
+    Adds, or removes, an entry's header fields from the index's statistics
+
+    Arguments:
+        index (dict): The index we're counting in
+        entry (DreamEntry): The entry being counted
+        amount (int): 1 to add the entry, -1 to remove it
+    """
+
+    for field in HEADER_FIELDS:
+        counter = index["statistics"][field]
+        # A field can hold multiple values, eg. Lucid, Vivid
+        for value in getattr(entry, field).split(", "):
+            counter[value] += amount
+            if counter[value] <= 0:
+                del counter[value]
+
+# [✅]
+def mark_entry(index, entry, present):
+    """
+    Sets, or clears, an entry's bit inside the bitmaps of its header field
+    values. Every entry has a stable id inside the index, which is its bit.
+    The bitmaps are bytearrays, so changing a bit doesn't rebuild the whole
+    bitmap, they're only turned into ints when we filter
+
+    Arguments:
+        index (dict): The index we're marking in
+        entry (DreamEntry): The entry being marked
+        present (bool): True to set the entry's bits, False to clear them
+    """
+
+    # A new entry gets the next id, ids aren't reused while the index is loaded
+    entry_id = index["ids"].get(entry.path)
+    if entry_id is None:
+        entry_id = index["ids"][entry.path] = len(index["paths"])
+        index["paths"].append(entry.path)
+
+    position, bit = entry_id >> 3, 1 << (entry_id & 7)
+
+    for field in HEADER_FIELDS:
+        bitmaps = index["bitmaps"][field]
+        # A field can hold multiple values, eg. Lucid, Vivid
+        for value in getattr(entry, field).split(", "):
+            if present:
+                bitmap = bitmaps.setdefault(value, bytearray())
+                if len(bitmap) <= position:
+                    bitmap.extend(bytes(position + 1 - len(bitmap)))
+                bitmap[position] |= bit
+            elif value in bitmaps and position < len(bitmaps[value]):
+                bitmaps[value][position] &= ~bit
+
+# [✅]
+def put_entry(index, entry):
+    """
+    Stores an entry inside the index, keeping our statistics and bitmaps up to date
+
+    Arguments:
+        index (dict): The index we're storing the entry in
+        entry (DreamEntry): The entry we want to store
+    """
+
+    old_entry = index["entries"].get(entry.path)
+    if old_entry is not None:
+        count_entry(index, old_entry, -1)
+        mark_entry(index, old_entry, False)
+
+    index["entries"][entry.path] = entry
+    count_entry(index, entry, 1)
+    mark_entry(index, entry, True)
+    index["dirty"] = True
+    index["revision"] += 1
+
+# [✅]
+def drop_entry(index, file_path):
+    """
+    Removes an entry from the index, keeping our statistics and bitmaps up to date
+
+    Arguments:
+        index (dict): The index we're removing the entry from
+        file_path (str): The location of the entry
+    """
+
+    old_entry = index["entries"].pop(file_path, None)
+    if old_entry is not None:
+        count_entry(index, old_entry, -1)
+        mark_entry(index, old_entry, False)
+
+        # The id is left empty, so every other entry keeps its bit
+        index["paths"][index["ids"].pop(file_path)] = None
+        index["dirty"] = True
+        index["revision"] += 1
+
+# [✅]
+def filter_entries(index, filters):
+    """
+    Finds the entries that have every header field value we're filtering
+    for, each value is a bitmap of entry ids, so this is just an AND
+
+    Arguments:
+        index (dict): The index we're filtering
+        filters (dict): The values we want for each field, {field: [values]}
+
+    Returns:
+        A set of the file paths of every matching entry
+    """
+
+    # Every entry we have, until a filter says otherwise
+    matches = (1 << len(index["paths"])) - 1
+
+    for field, values in filters.items():
+        # The values are matched without caring about case, each bitmap becomes an int once
+        bitmaps = {}
+        for value, bitmap in index["bitmaps"][field].items():
+            bitmaps[value.casefold()] = bitmaps.get(value.casefold(), 0) | int.from_bytes(bitmap, 'little')
+
+        for value in values:
+            matches &= bitmaps.get(value.casefold(), 0)
+
+    # Turning our bits back into the paths they belong to, the lowest bit is the last character
+    bits = format(matches, 'b')[::-1]
+    paths = set()
+    position = bits.find('1')
+    while position != -1:
+        paths.add(index["paths"][position])
+        position = bits.find('1', position + 1)
+
+    paths.discard(None)
+    return paths
+
+# [✅]
+def load_index(directory):
+    """
+    Loads the metadata index for a directory from index.json, if the
+    index is missing, unreadable, or for another directory we start fresh
+
+    Arguments:
+        directory (str): The journal directory the index belongs to
+
+    Returns:
+        The index, a dictionary with our DreamEntry's stored under 'entries',
+        the counts of every header field value under 'statistics', and the
+        bitmaps of the entries with every header field value under 'bitmaps'
+    """
+
+    global _index_cache
+
+    # If we've already loaded this index, reuse it
+    if _index_cache is not None and _index_cache["directory"] == directory:
+        return _index_cache
+
+    # An empty index, used whenever we can't trust the one on disk
+    index = {
+        "version": INDEX_VERSION,
+        "directory": directory,
+        "entries": {},
+        "statistics": {field: Counter() for field in HEADER_FIELDS},
+        "ids": {},
+        "paths": [],
+        "bitmaps": {field: {} for field in HEADER_FIELDS},
+        "dirty": False,
+        # Counts every change made while the index is loaded, so other indexes know when to update
+        "revision": 0,
+    }
+
+    try:
+        with open(INDEX_FILE, 'r') as file:
+            stored = json.load(file)
+
+        # Only use the stored index if it matches our layout and journal
+        if stored.get("version") == INDEX_VERSION and stored.get("directory") == directory:
+            index["entries"] = {
+                file_path: DreamEntry.from_record(file_path, record)
+                for file_path, record in stored["entries"].items()
+            }
+            index["statistics"] = {field: Counter(stored["statistics"][field]) for field in HEADER_FIELDS}
+
+    # A missing or corrupted index is not critical, we'll just rebuild it
+    except (OSError, ValueError, TypeError, KeyError):
+        index["entries"] = {}
+        index["statistics"] = {field: Counter() for field in HEADER_FIELDS}
+
+    # The bitmaps aren't stored, they're quick to build from our entries
+    for entry in index["entries"].values():
+        mark_entry(index, entry, True)
+
+    _index_cache = index
+    return index
+
+# [✅]
+def save_index(index):
+    """
+    Writes the metadata index to index.json, we write to a temporary
+    file first so that a crash can never leave half an index behind
+
+    Arguments:
+        index (dict): The index we want to save
+
+    Returns:
+        True if the index was saved, False otherwise
+    """
+
+    temporary_path = INDEX_FILE + '.tmp'
+
+    stored = {
+        "version": index["version"],
+        "directory": index["directory"],
+        "entries": {file_path: entry.to_record() for file_path, entry in index["entries"].items()},
+        "statistics": index["statistics"],
+    }
+
+    try:
+        with open(temporary_path, 'w') as file:
+            json.dump(stored, file, separators=(',', ':'))
+
+        # Swap the new index in, this is atomic on the same filesystem
+        os.replace(temporary_path, INDEX_FILE)
+        index["dirty"] = False
+        return True
+
+    except OSError as e:
+        log("Failed To Save Index", e)
+        return False
+
+# [✅]
+def flush_index():
+    """
+    Saves the index loaded in this run, if anything inside it has changed.
+    This is called after every command, so bulk changes only save once
+    """
+
+    if _index_cache is not None and _index_cache["dirty"]:
+        save_index(_index_cache)
+
+# [✅]
+def refresh_index(directory):
+    """
+    Brings the metadata index up to date with the files inside a directory.
+    Every entry is checked against its mtime and size, and only the entries
+    that were added or changed are read again
+
+    Arguments:
+        directory (str): The journal directory we want to index
+
+    Returns:
+        The index entries, a dictionary of {file_path: DreamEntry}
+    """
+
+    index = load_index(directory)
+    entries = index["entries"]
+
+    # Keeping track of what we've seen, so we can drop deleted entries
+    seen = set()
+
+    # Checking if every entry we find is still valid
+    for file_path, stat in walk_entries(directory):
+        seen.add(file_path)
+
+        entry = entries.get(file_path)
+        if entry is None or entry.mtime != stat.st_mtime_ns or entry.size != stat.st_size:
+            put_entry(index, read_entry_header(file_path, stat))
+
+    # Removing the entries that no longer exist
+    for file_path in [file_path for file_path in entries if file_path not in seen]:
+        drop_entry(index, file_path)
+
+    # Only write the index back to disk if something changed
+    flush_index()
+
+    return entries
+
+# [✅]
+def get_entry(file_path):
+    """
+    Gets the parsed header of a single entry, reusing the index if the
+    entry hasn't changed since we last read it. This is also how we tell
+    the index about an entry we've just created or edited
+
+    Arguments:
+        file_path (str): The location of the entry
+
+    Returns:
+        The entry's DreamEntry
+    """
+
+    index = load_index(JOURNAL_DIRECTORY)
+    entry = index["entries"].get(file_path)
+
+    try:
+        stat = stat_entry(file_path)
+    except OSError:
+        return entry if entry is not None else DreamEntry(file_path)
+
+    # The entry changed, or we've never seen it, let's read it again
+    if entry is None or entry.mtime != stat.st_mtime_ns or entry.size != stat.st_size:
+        entry = read_entry_header(file_path, stat)
+        if os.path.commonpath([JOURNAL_DIRECTORY, file_path]) == JOURNAL_DIRECTORY:
+            put_entry(index, entry)
+
+    return entry
+
+# [✅]
+def forget_entry(file_path):
+    """
+    Tells the index that an entry was deleted
+
+    Arguments:
+        file_path (str): The location of the deleted entry
+    """
+
+    drop_entry(load_index(JOURNAL_DIRECTORY), file_path)
+
+# [✅]
+def list_entries(directory):
+    """
+    A function that lists every dream inside a directory, using the
+    metadata index so only the new or changed entries are opened
+
+    Arguments:
+        directory (str): The directory we want to search
+
+    Returns:
+        All the DreamEntry's organized by date [Newest -> Oldest]
+        Sort Check: Year, Month, Day, and creation time
+    """
+
+    # A database lists its entries in order with a single query
+    store = entry_store()
+    if isinstance(store, DatabaseStore):
+        return store.entries(directory)
+
+    # Every entry inside our index, malformed dates are DIRTY_ORDINAL, so they come last
+    entries = list(refresh_index(directory).values())
+
+    # Sort by date (newest to oldest), and then by creation time (newest to oldest)
+    entries.sort(key=lambda entry: (entry.date, entry.ctime), reverse=True)
+
+    # Return the list of entries, sorted by date and creation time
+    return entries
+
+# [✅]
+def iter_journal_files(directory):
+    """
+    Walks the journal's year, month, and day directories, newest first, using
+    their names, so entries are found in order without reading any of them.
+    Only the entries of a single day are sorted, by their creation time.
+    Files that aren't inside a year/month/day directory are found last
+
+    Arguments:
+        directory (str): The journal directory
+
+    Yields:
+        The file path of every entry and the ordinal of its day directory, or
+        DIRTY_ORDINAL if it's outside our layout [Newest -> Oldest]
+    """
+
+    # A packed journal, or database, has no directories, it knows the order of its entries
+    store = entry_store()
+    if store is not None:
+        yield from store.ordered(directory)
+        return
+
+    # Entries that aren't where create_dream() would put them
+    strays = []
+
+    def scan(path):
+        """Splits a directory into its sub directories, and its .txt files."""
+        folders, files = {}, []
+        try:
+            with os.scandir(path) as iterator:
+                for item in iterator:
+                    if item.is_dir():
+                        folders[item.name] = item.path
+                    elif item.name.endswith(".txt"):
+                        files.append(item)
+        except OSError as e:
+            log("Failed To Read Directory", e)
+        return folders, files
+
+    def newest_first(entries):
+        """Sorts paths, or scandir items, by their creation time, dropping any that were deleted while we walked."""
+        created = []
+        for entry in entries:
+            try:
+                created.append((entry.stat().st_ctime if isinstance(entry, os.DirEntry) else os.stat(entry).st_ctime, os.fspath(entry)))
+            except OSError:
+                continue
+        created.sort(key=lambda item: item[0], reverse=True)
+        return [file_path for _, file_path in created]
+
+    def stray(path):
+        """Collects every .txt under a directory that isn't part of our layout."""
+        for root, _, file_names in os.walk(path):
+            strays.extend(os.path.join(root, file_name) for file_name in file_names if file_name.endswith(".txt"))
+
+    years, files = scan(directory)
+    strays.extend(item.path for item in files)
+
+    for year in sorted(years, key=lambda name: int(name) if name.isdigit() else -1, reverse=True):
+        if not year.isdigit():
+            stray(years[year])
+            continue
+
+        months, files = scan(years[year])
+        strays.extend(item.path for item in files)
+
+        for month in sorted(months, key=lambda name: MONTHS_REVERSED.get(name, '00'), reverse=True):
+            if month not in MONTHS_REVERSED:
+                stray(months[month])
+                continue
+
+            days, files = scan(months[month])
+            strays.extend(item.path for item in files)
+
+            for day in sorted(days, key=lambda name: int(name) if name.isdigit() else -1, reverse=True):
+                # The day has to exist, so our ordinals stay in order
+                try:
+                    ordinal = datetime(int(year), int(MONTHS_REVERSED[month]), int(day)).toordinal()
+                except ValueError:
+                    stray(days[day])
+                    continue
+
+                folders, files = scan(days[day])
+                for folder in folders.values():
+                    stray(folder)
+
+                # Entries from the same day, the latest created comes first
+                for file_path in newest_first(files):
+                    yield file_path, ordinal
+
+    # The entries outside our layout, the latest created comes first
+    for file_path in newest_first(strays):
+        yield file_path, DIRTY_ORDINAL
+
+# [✅]
+class JournalListing:
+    """
+    A list of the journal's entries [Newest -> Oldest] that's filled in by a
+    background thread, so the newest entry can be shown before the rest of
+    the journal has been listed. Alongside the paths we keep their negated
+    date ordinals, which are sorted [Oldest -> Newest is largest], so we can
+    bisect to a date
+    """
+
+    def __init__(self, directory):
+        # The paths found so far, this list only ever grows at its end
+        self.paths = []
+        self.ordinals = array('q')
+        self.done = threading.Event()
+        self.condition = threading.Condition()
+
+        self.thread = threading.Thread(target=self.run, args=(directory,), daemon=True)
+        self.thread.start()
+
+    def run(self, directory):
+        """The background thread, adding every entry as it's found."""
+
+        try:
+            for file_path, ordinal in iter_journal_files(directory):
+                with self.condition:
+                    self.paths.append(file_path)
+                    self.ordinals.append(-ordinal)
+                    self.condition.notify_all()
+        finally:
+            with self.condition:
+                self.done.set()
+                self.condition.notify_all()
+
+    def wait_for(self, count):
+        """Waits until we have at least count entries, or the whole journal is listed."""
+
+        with self.condition:
+            while len(self.paths) < count and not self.done.is_set():
+                self.condition.wait()
+
+    def wait(self):
+        """Waits until the whole journal is listed."""
+
+        self.done.wait()
+
+    def remove(self, file_path):
+        """Removes a deleted entry from the list."""
+
+        with self.condition:
+            if file_path in self.paths:
+                position = self.paths.index(file_path)
+                del self.paths[position]
+                del self.ordinals[position]
+
+    def find(self, start, end):
+        """
+        Finds the entry to land on for a range of dates, the newest entry
+        inside the range, or the entry closest to it if it's empty
+
+        Arguments:
+            start (int): The ordinal of the first day of the range
+            end (int): The ordinal of the last day of the range
+
+        Returns:
+            The index of the entry, or None if we have no dated entries
+        """
+
+        self.wait()
+
+        with self.condition:
+            # The first entry on, or before, the end of our range
+            position = bisect.bisect_left(self.ordinals, -end)
+
+            # It's inside our range
+            if position < len(self.ordinals) and -self.ordinals[position] >= start:
+                return position
+
+            # Otherwise it's the closest of the entries either side of the range
+            newer = position - 1 if position > 0 else None
+            older = position if position < len(self.ordinals) and self.ordinals[position] != -DIRTY_ORDINAL else None
+
+            if newer is None or older is None:
+                return newer if older is None else older
+
+            return newer if -self.ordinals[newer] - end <= start + self.ordinals[older] else older
+
+# [✅]
+def parse_goto_date(text):
+    """
+    Turns a date, or a partial date, into the range of days it covers
+
+    Arguments:
+        text (str): The date, YYYY, YYYY/MM, or YYYY/MM/DD
+
+    Returns:
+        The ordinals of the first and last day of the range, or None if it's malformed
+    """
+
+    parts = re.split(r"[/-]", text.strip())
+
+    try:
+        numbers = [int(part) for part in parts]
+
+        if len(numbers) == 1:
+            year, = numbers
+            return datetime(year, 1, 1).toordinal(), datetime(year, 12, 31).toordinal()
+
+        if len(numbers) == 2:
+            year, month = numbers
+            # The last day of the month is the day before the next month starts
+            end = datetime(year + month // 12, month % 12 + 1, 1).toordinal() - 1
+            return datetime(year, month, 1).toordinal(), end
+
+        if len(numbers) == 3:
+            ordinal = datetime(*numbers).toordinal()
+            return ordinal, ordinal
+
+    except (ValueError, OverflowError):
+        pass
+
+    return None
+
+# The version of our trigram index layout, bump this if it changes
+TRIGRAM_INDEX_VERSION = 1
+
+# The version of our term index layout, bump this if it changes
+TERM_INDEX_VERSION = 1
+
+# [✅]
+class PostingsIndex(abc.ABC):
+    """
+    A persistent index of postings over the text of every entry, kept in step
+    with the metadata index. Changed or deleted entries leave their old id
+    behind as a tombstone, which is cleared out once enough pile up.
+    Subclasses decide what goes into the postings, and where it's stored
+    """
+
+    # The version of the index layout, set by every subclass
+    VERSION = None
+
+    def __init__(self, directory):
+        self.directory = directory
+        # {file_path: [doc_id, mtime, size]}
+        self.documents = {}
+        # The path of every doc_id, None if the entry was removed
+        self.paths = []
+        # {key: array}, the doc_id's inside every posting are always in increasing order
+        self.postings = {}
+        self.tombstones = 0
+
+    @staticmethod
+    @abc.abstractmethod
+    def location():
+        """Returns where the index is stored."""
+
+    @classmethod
+    def load(cls, directory):
+        """
+        Loads the index from disk, starting fresh if it's missing or outdated
+
+        Arguments:
+            directory (str): The journal directory the index belongs to
+
+        Returns:
+            An instance of the index
+        """
+
+        try:
+            with open(cls.location(), 'rb') as file:
+                version, stored = pickle.load(file)
+
+            if version == cls.VERSION and stored["directory"] == directory:
+                index = cls(directory)
+                index.__dict__.update(stored)
+                return index
+
+        # A missing or corrupted index is not critical, we'll just rebuild it
+        except Exception:
+            pass
+
+        return cls(directory)
+
+    def save(self):
+        """Writes the index to disk, through a temporary file."""
+
+        temporary_path = self.location() + '.tmp'
+        try:
+            with open(temporary_path, 'wb') as file:
+                # We only store plain data, so the file doesn't depend on how this module was imported
+                pickle.dump((self.VERSION, self.__dict__), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self.location())
+        except OSError as e:
+            log("Failed To Save Index", e)
+
+    @abc.abstractmethod
+    def add(self, file_path, mtime, size):
+        """Reads an entry and adds it to the postings under a new doc_id."""
+
+    def new_document(self, file_path, mtime, size):
+        """Gives an entry the next doc_id."""
+
+        doc_id = len(self.paths)
+        self.paths.append(file_path)
+        self.documents[file_path] = [doc_id, mtime, size]
+        return doc_id
+
+    def remove(self, file_path):
+        """Turns an entry's doc_id into a tombstone."""
+
+        doc_id = self.documents.pop(file_path)[0]
+        self.paths[doc_id] = None
+        self.tombstones += 1
+        return doc_id
+
+    @staticmethod
+    def renumber(posting, renumbered):
+        """Drops the tombstones from a posting, using the new doc_id's."""
+        return array(posting.typecode, (renumbered[doc_id] for doc_id in posting if doc_id in renumbered))
+
+    def compact(self):
+        """Drops every tombstone from the postings, and renumbers the doc_id's."""
+
+        # Mapping our old doc_id's to the new ones
+        renumbered = {}
+        paths = []
+        for doc_id, file_path in enumerate(self.paths):
+            if file_path is not None:
+                renumbered[doc_id] = len(paths)
+                self.documents[file_path][0] = len(paths)
+                paths.append(file_path)
+
+        postings = {}
+        for key, posting in self.postings.items():
+            posting = self.renumber(posting, renumbered)
+            if posting:
+                postings[key] = posting
+
+        self.paths = paths
+        self.postings = postings
+        self.tombstones = 0
+
+    def update(self, entries):
+        """
+        Brings the index up to date with the metadata index, only the
+        entries that were added or changed are read again
+
+        Arguments:
+            entries (dict): The metadata index entries, {file_path: DreamEntry}
+
+        Returns:
+            True if the index changed, False otherwise
+        """
+
+        changed = False
+
+        # Removing entries that were deleted or changed
+        for file_path, (_, mtime, size) in list(self.documents.items()):
+            entry = entries.get(file_path)
+            if entry is None or entry.mtime != mtime or entry.size != size:
+                self.remove(file_path)
+                changed = True
+
+        # Adding entries that are new, or were just removed because they changed
+        for file_path, entry in entries.items():
+            if file_path not in self.documents:
+                self.add(file_path, entry.mtime, entry.size)
+                changed = True
+
+        # Once half of our doc_id's are tombstones, clear them out
+        if self.tombstones and self.tombstones * 2 >= len(self.paths):
+            self.compact()
+
+        return changed
+
+# [✅]
+class TrigramIndex(PostingsIndex):
+    """
+    A persistent trigram index over the casefolded text of every entry,
+    used to narrow down which entries could contain a search keyword
+    before we open any of them
+    """
+
+    VERSION = TRIGRAM_INDEX_VERSION
+
+    @staticmethod
+    def location():
+        """Returns where the index is stored."""
+        return TRIGRAM_INDEX_FILE
+
+    @staticmethod
+    def trigrams(text):
+        """Returns the set of trigrams inside a casefolded piece of text."""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def add(self, file_path, mtime, size):
+        """Reads an entry and adds its trigrams under a new doc_id."""
+
+        try:
+            with open_entry(file_path) as file:
+                text = file.read().casefold()
+        except OSError:
+            return
+
+        doc_id = self.new_document(file_path, mtime, size)
+
+        for trigram in self.trigrams(text):
+            posting = self.postings.get(trigram)
+            if posting is None:
+                self.postings[trigram] = array('I', (doc_id,))
+            else:
+                posting.append(doc_id)
+
+    def candidates(self, keyword):
+        """
+        Finds the entries that could contain a keyword, every one of them
+        still has to be checked, but no other entry can contain it
+
+        Arguments:
+            keyword (str): The casefolded keyword we're searching for
+
+        Returns:
+            A set of file paths, or None if the keyword is too short to narrow anything down
+        """
+
+        trigrams = self.trigrams(keyword)
+        if not trigrams:
+            return None
+
+        # Intersecting the smallest postings first keeps our set small
+        postings = sorted((self.postings.get(trigram, ()) for trigram in trigrams), key=len)
+        doc_ids = set(postings[0])
+        for posting in postings[1:]:
+            if not doc_ids:
+                break
+            doc_ids.intersection_update(posting)
+
+        return {self.paths[doc_id] for doc_id in doc_ids if self.paths[doc_id] is not None}
+
+# The in-memory copy of our trigram index, so we only load it once per run
+_trigram_index = None
+
+# Held while the trigram index is loaded, updated, or read, searches can run in the background
+_trigram_lock = threading.Lock()
+
+# [✅]
+def load_trigram_index():
+    """
+    Gets the trigram index of our journal, only loading it from disk once per run
+
+    Returns:
+        The TrigramIndex, it might be missing entries that changed since it was last updated
+    """
+
+    global _trigram_index
+
+    if _trigram_index is None or _trigram_index.directory != JOURNAL_DIRECTORY:
+        _trigram_index = TrigramIndex.load(JOURNAL_DIRECTORY)
+
+    return _trigram_index
+
+# [✅]
+def entry_contains(file_path, keyword):
+    """
+    Checks if an entry contains a keyword, the trigram index only narrows
+    our search down, so every candidate is checked with this
+
+    Arguments:
+        file_path (str): The location of the entry
+        keyword (str): The keyword we're searching for, already casefolded
+
+    Returns:
+        True if the entry contains the keyword, False if it doesn't, or couldn't be read
+    """
+
+    try:
+        with open_entry(file_path) as file:
+            return keyword in file.read().casefold()
+    except OSError as e:
+        log("Failed To Search Dream @", file_path)
+        return False
+
+# [✅]
+class SearchScan:
+    """
+    Searches our dream entries for a keyword [case insensitive] in the
+    background, the entries are read by a pool of threads in chunks, and the
+    chunks are collected in order, so results show up as soon as they're found.
+    The trigram index is loaded alongside the search, once it's ready, the
+    entries it knows can't contain the keyword are skipped
+    """
+
+    def __init__(self, listing, keyword):
+        self.listing = listing
+        self.keyword = keyword.casefold()
+
+        # The (file_path, index) of every match so far, in the order of the listing
+        self.results = []
+        self.condition = threading.Condition()
+        self.done = threading.Event()
+        self.cancelled = threading.Event()
+
+        # The entries that could contain our keyword, None until the trigram index is ready
+        self.candidates = None
+        self.documents = {}
+
+        # A copy of the index's entries, taken on our thread, navigating adds to the index while we search
+        self.entries = dict(load_index(JOURNAL_DIRECTORY)["entries"])
+
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def load_candidates(self):
+        """Narrows down the entries we have to read with the trigram index."""
+
+        with _trigram_lock:
+            trigram_index = load_trigram_index()
+            candidates = trigram_index.candidates(self.keyword)
+            self.documents = dict(trigram_index.documents)
+        self.candidates = candidates
+
+    def skip(self, file_path):
+        """Checks if the trigram index knows an entry can't contain our keyword."""
+
+        candidates = self.candidates
+        if candidates is None or file_path in candidates:
+            return False
+
+        # The index can only answer for the entries that haven't changed since it was updated
+        document = self.documents.get(file_path)
+        entry = self.entries.get(file_path)
+        return document is not None and entry is not None and document[1:] == [entry.mtime, entry.size]
+
+    def check(self, chunk):
+        """Reads a chunk of (index, file_path) and returns the matches."""
+
+        matches = []
+        for index, file_path in chunk:
+            if self.cancelled.is_set():
+                break
+            if not self.skip(file_path) and entry_contains(file_path, self.keyword):
+                matches.append((file_path, index))
+
+        return matches
+
+    def run(self):
+        """The background thread, handing out chunks and collecting the matches in order."""
+
+        try:
+            with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+                executor.submit(self.load_candidates)
+
+                pending = deque()
+                position = 0
+                listed = False
+
+                while not self.cancelled.is_set():
+                    # Keeping every worker busy, without reading too far ahead of our results
+                    while not listed and len(pending) < SEARCH_WORKERS * 2:
+                        self.listing.wait_for(position + SEARCH_CHUNK)
+                        chunk = list(enumerate(self.listing.paths[position:position + SEARCH_CHUNK], position))
+                        if not chunk:
+                            listed = True
+                            break
+                        position += len(chunk)
+                        pending.append(executor.submit(self.check, chunk))
+
+                    if not pending:
+                        break
+
+                    matches = pending.popleft().result()
+                    if matches:
+                        with self.condition:
+                            self.results.extend(matches)
+                            self.condition.notify_all()
+
+                executor.shutdown(cancel_futures=True)
+
+        finally:
+            with self.condition:
+                self.done.set()
+                self.condition.notify_all()
+
+        # Bringing the trigram index up to date, so our next search can skip more entries
+        if not self.cancelled.is_set():
+            with _trigram_lock:
+                trigram_index = load_trigram_index()
+                if trigram_index.update(self.entries):
+                    trigram_index.save()
+
+    def wait(self):
+        """Waits until the search has finished."""
+
+        self.done.wait()
+
+    def cancel(self):
+        """Stops the search, the matches found so far are kept."""
+
+        self.cancelled.set()
+
+# [✅]
+class TermIndex(PostingsIndex):
+    """
+    A persistent inverted index of the words inside every entry, along with
+    how often they appear, so searches can be ranked with BM25. Every
+    posting is a flat array of [doc_id, term frequency, doc_id, ...]
+    """
+
+    VERSION = TERM_INDEX_VERSION
+
+    def __init__(self, directory):
+        super().__init__(directory)
+        # The number of words inside every doc_id, and inside every live entry
+        self.lengths = array('I')
+        self.total_length = 0
+
+    @staticmethod
+    def location():
+        """Returns where the index is stored."""
+        return TERM_INDEX_FILE
+
+    def add(self, file_path, mtime, size):
+        """Reads an entry and adds its term frequencies under a new doc_id."""
+
+        try:
+            with open_entry(file_path) as file:
+                terms = TERM_PATTERN.findall(file.read().casefold())
+        except OSError:
+            return
+
+        doc_id = self.new_document(file_path, mtime, size)
+        self.lengths.append(len(terms))
+        self.total_length += len(terms)
+
+        for term, frequency in Counter(terms).items():
+            posting = self.postings.get(term)
+            if posting is None:
+                self.postings[term] = array('I', (doc_id, frequency))
+            else:
+                posting.extend((doc_id, frequency))
+
+    def remove(self, file_path):
+        """Turns an entry's doc_id into a tombstone."""
+
+        doc_id = super().remove(file_path)
+        self.total_length -= self.lengths[doc_id]
+        return doc_id
+
+    @staticmethod
+    def renumber(posting, renumbered):
+        """Drops the tombstones from a posting, using the new doc_id's."""
+
+        kept = array('I')
+        for i in range(0, len(posting), 2):
+            if posting[i] in renumbered:
+                kept.extend((renumbered[posting[i]], posting[i + 1]))
+        return kept
+
+    def compact(self):
+        """Drops every tombstone, along with its length, and renumbers the doc_id's."""
+
+        self.lengths = array('I', (length for length, file_path in zip(self.lengths, self.paths) if file_path is not None))
+        super().compact()
+
+    def frequencies(self, term):
+        """Returns {doc_id: term frequency} for every live entry containing a term."""
+
+        posting = self.postings.get(term, ())
+        paths = self.paths
+        return {
+            posting[i]: posting[i + 1]
+            for i in range(0, len(posting), 2) if paths[posting[i]] is not None
+        }
+
+# [✅]
+def parse_query(text):
+    """
+    Parses a ranked search query. Words next to each other must all match,
+    "quoted words" must match as a phrase, and AND, OR, NOT and brackets
+    work as you'd expect, NOT binds tightest, and OR loosest
+
+    Arguments:
+        text (str): The query, eg. flying OR "deep ocean" NOT shark
+
+    Returns:
+        The query as a tree of tuples, ('term', word), ('phrase', words),
+        ('not', node), ('and', nodes), or ('or', nodes), or None if it's empty
+    """
+
+    tokens = re.findall(r'"[^"]*"?|\(|\)|[^\s()"]+', text)
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else None
+
+    def parse_or():
+        nonlocal position
+        nodes = [parse_and()]
+        while peek() == "OR":
+            position += 1
+            nodes.append(parse_and())
+        nodes = [node for node in nodes if node is not None]
+        if len(nodes) > 1:
+            return ('or', nodes)
+        return nodes[0] if nodes else None
+
+    def parse_and():
+        nonlocal position
+        nodes = []
+        while peek() not in (None, "OR", ")"):
+            if peek() == "AND":
+                position += 1
+                continue
+            nodes.append(parse_not())
+        nodes = [node for node in nodes if node is not None]
+        if len(nodes) > 1:
+            return ('and', nodes)
+        return nodes[0] if nodes else None
+
+    def parse_not():
+        nonlocal position
+        token = tokens[position]
+        position += 1
+
+        if token == "NOT":
+            if peek() in (None, "OR", ")"):
+                return None
+            node = parse_not()
+            return ('not', node) if node is not None else None
+
+        if token == "(":
+            node = parse_or()
+            if peek() == ")":
+                position += 1
+            return node
+
+        # Words, eg. don't, are split the same way the index splits them
+        words = TERM_PATTERN.findall(token.strip('"').casefold())
+        if not words:
+            return None
+        if token.startswith('"') or len(words) > 1:
+            return ('phrase', words) if len(words) > 1 else ('term', words[0])
+        return ('term', words[0])
+
+    # Unmatched closing brackets are skipped
+    node = None
+    while position < len(tokens):
+        part = parse_or()
+        if part is not None:
+            node = part if node is None else ('and', [node, part])
+        if peek() == ")":
+            position += 1
+
+    return node
+
+# The in-memory copy of our term index, so we only load it once per run
+_term_index = None
+
+# The metadata index, and its revision, our term index was last updated with
+_term_index_revision = None
+
+# [✅]
+def rank_entries(query, limit=SEARCH_RESULTS):
+    """
+    Searches our dream entries with a query, and ranks the matching entries
+    with BM25, using the term index so only phrase matches open any entries
+
+    Arguments:
+        query (str): The query we're searching with, see parse_query()
+        limit (int): How many of the best results we want
+
+    Returns:
+        A list of (file_path, score) for the best matching entries [Best -> Worst],
+        and a tuple of the words and phrases to highlight
+    """
+
+    global _term_index, _term_index_revision
+
+    # Loading our index, and updating the entries that changed since the last search,
+    # the metadata index is kept up to date as entries are created, edited and deleted
+    if _term_index is None or _term_index.directory != JOURNAL_DIRECTORY:
+        _term_index = TermIndex.load(JOURNAL_DIRECTORY)
+        _term_index_revision = None
+
+    metadata = load_index(JOURNAL_DIRECTORY)
+    if _term_index_revision != (id(metadata), metadata["revision"]):
+        if _term_index.update(metadata["entries"]):
+            _term_index.save()
+        _term_index_revision = (id(metadata), metadata["revision"])
+
+    index = _term_index
+    tree = parse_query(query)
+    if tree is None or not index.documents:
+        return [], ()
+
+    # The term frequencies we've looked up, and the words and phrases we're ranking with
+    frequencies = {}
+    highlights = []
+
+    def lookup(term):
+        if term not in frequencies:
+            frequencies[term] = index.frequencies(term)
+        return frequencies[term]
+
+    def phrase_matches(words):
+        # Only the entries with every word can have the phrase, those we check
+        doc_ids = set(lookup(words[0]))
+        for word in words[1:]:
+            doc_ids.intersection_update(lookup(word))
+
+        pattern = re.compile(r"\b" + r"\W+".join(re.escape(word) for word in words) + r"\b")
+        matches = set()
+        for doc_id in doc_ids:
+            try:
+                with open_entry(index.paths[doc_id]) as file:
+                    if pattern.search(file.read().casefold()):
+                        matches.add(doc_id)
+            except OSError:
+                log("Failed To Search Dream @", index.paths[doc_id])
+        return matches
+
+    def evaluate(node, positive):
+        kind, value = node
+
+        if kind == 'term':
+            if positive:
+                highlights.append(value)
+            return set(lookup(value))
+
+        if kind == 'phrase':
+            if positive:
+                highlights.append(" ".join(value))
+            return phrase_matches(value)
+
+        if kind == 'not':
+            return all_documents() - evaluate(value, not positive)
+
+        if kind == 'or':
+            return set().union(*(evaluate(child, positive) for child in value))
+
+        # An AND, the NOT's are taken away at the end, instead of from every entry
+        included = [evaluate(child, positive) for child in value if child[0] != 'not']
+        excluded = [evaluate(child[1], not positive) for child in value if child[0] == 'not']
+        matches = set.intersection(*included) if included else all_documents()
+        for documents in excluded:
+            matches -= documents
+        return matches
+
+    def all_documents():
+        return {doc_id for doc_id, _, _ in index.documents.values()}
+
+    matches = evaluate(tree, True)
+
+    # Scoring every match with BM25, over every word we're not excluding
+    count = len(index.documents)
+    average_length = index.total_length / count or 1
+    scores = dict.fromkeys(matches, 0.0)
+
+    for term in {word for highlight in highlights for word in highlight.split()}:
+        documents = lookup(term)
+        if not documents:
+            continue
+        idf = math.log(1 + (count - len(documents) + 0.5) / (len(documents) + 0.5))
+
+        for doc_id in matches.intersection(documents):
+            frequency = documents[doc_id]
+            normalized = 1 - BM25_B + BM25_B * index.lengths[doc_id] / average_length
+            scores[doc_id] += idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * normalized)
+
+    best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+    return [(index.paths[doc_id], score) for doc_id, score in best], tuple(dict.fromkeys(highlights))
+
+# [✅]
+class Renderer:
+    """
+    Colors the lines of an entry. Every line is colored with one compiled
+    pattern: the header field values, N/A's, [U] and [EMPTY] tags, and the
+    search keyword are all part of the same alternation. The patterns are
+    built once, and once per search keyword
+    """
+
+    # The tags we color wherever they are, and the line they're on [None for every line]
+    TAGS = {
+        "[U]": (0, Color.RED),
+        "[EMPTY]": (None, Color.RED),
+    }
+
+    def __init__(self):
+        # The colors of every keyword, for each line number
+        self.line_colors = {}
+
+        for field, (line_number, _) in HEADER_FIELDS.items():
+            self.line_colors[line_number] = dict(HEADER_COLORS[field])
+            # Color the N/A's
+            self.line_colors[line_number]["N/A"] = Color.RED
+
+        for tag, (line_number, color) in self.TAGS.items():
+            if line_number is not None:
+                self.line_colors.setdefault(line_number, {})[tag] = color
+
+        # The tags for every other line
+        self.default_colors = {tag: color for tag, (line_number, color) in self.TAGS.items() if line_number is None}
+        for colors in self.line_colors.values():
+            colors.update(self.default_colors)
+
+        # Our compiled patterns, for each (line number, search keyword)
+        self.patterns = {}
+
+        # The functions that color each match, for each line number
+        self.replacements = {line_number: self.replacement(colors) for line_number, colors in self.line_colors.items()}
+        self.replacements[None] = self.replacement(self.default_colors)
+
+        # The patterns used to color the values of a single field, used by the statistics
+        self.field_patterns = {
+            field: self.compile(HEADER_COLORS[field], None) for field in HEADER_FIELDS
+        }
+
+    @staticmethod
+    def compile(colors, keyword):
+        """
+        Compiles an alternation of every keyword we color, longest first,
+        with the search keyword [case insensitive] as its own group, a
+        ranked search highlights a tuple of words and phrases instead
+        """
+
+        alternatives = [re.escape(text) for text in sorted(colors, key=len, reverse=True)]
+        if keyword:
+            keywords = (keyword,) if isinstance(keyword, str) else keyword
+            searched = "|".join(re.escape(text) for text in sorted(keywords, key=len, reverse=True))
+            alternatives.insert(0, f"(?P<search>(?i:{searched}))")
+
+        return re.compile("|".join(alternatives)) if alternatives else None
+
+    def highlighter(self, keyword):
+        """
+        Gets the patterns used to render an entry while searching for a keyword
+
+        Arguments:
+            keyword (str | tuple): The searched keyword, the words of a ranked search, or None
+
+        Returns:
+            The keyword, used as the highlighter of render_line()
+        """
+
+        keyword = keyword or None
+        if (None, keyword) not in self.patterns:
+            self.patterns[(None, keyword)] = self.compile(self.default_colors, keyword)
+            for line_number, colors in self.line_colors.items():
+                self.patterns[(line_number, keyword)] = self.compile(colors, keyword)
+
+        return keyword
+
+    @staticmethod
+    def replacement(colors):
+        """Creates the function that colors each match of a pattern."""
+
+        def replace(match):
+            text = match.group(0)
+            if match.lastgroup == "search":
+                return f"{Color.GREEN}{Color.UNDERLINE}{text}{Color.END}"
+            return f"{colors[text]}{text}{Color.END}"
+
+        return replace
+
+    def render_line(self, line_number, line, highlighter=None):
+        """
+        Colors a single line of an entry
+
+        Arguments:
+            line_number (int): The line's number inside the entry, starting at 0
+            line (str): The line itself
+            highlighter (str): The result of highlighter(), if we're searching
+
+        Returns:
+            The colored line, without its surrounding whitespace
+        """
+
+        # Every line without its own colors shares the same pattern
+        if line_number not in self.line_colors:
+            line_number = None
+
+        pattern = self.patterns[(line_number, self.highlighter(highlighter))]
+
+        line = line.strip()
+        if pattern is not None:
+            line = pattern.sub(self.replacements[line_number], line)
+        return line
+
+    def color_field(self, field, text):
+        """
+        Colors a header field value, the same way it's colored inside an entry
+
+        Arguments:
+            field (str): The field, eg. 'dream_type'
+            text (str): The value, eg. 'Lucid'
+
+        Returns:
+            The colored value
+        """
+
+        colors = HEADER_COLORS[field]
+        return self.field_patterns[field].sub(lambda match: f"{colors[match.group(0)]}{match.group(0)}{Color.END}", text)
+
+# The renderer shared by display_dream() and statistics(), built once at startup
+RENDERER = Renderer()
+
+# [✅]
+class FrameCache:
+    """
+    A least recently used cache of rendered entries. Frames are keyed by
+    the entry's path, mtime, size and search keyword, so an edited entry
+    can never be shown out of date, and the oldest frames are dropped
+    once the cache grows past its memory limit
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.used = 0
+        self.frames = OrderedDict()
+        # Frames can be rendered from other threads
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """Returns a cached frame, or None, marking it as recently used."""
+
+        with self.lock:
+            frame = self.frames.get(key)
+            if frame is not None:
+                self.frames.move_to_end(key)
+            return frame
+
+    def put(self, key, frame):
+        """Stores a frame, dropping the least recently used ones if we're full."""
+
+        size = sys.getsizeof(frame)
+        if size > self.limit:
+            return
+
+        with self.lock:
+            old_frame = self.frames.pop(key, None)
+            if old_frame is not None:
+                self.used -= sys.getsizeof(old_frame)
+
+            self.frames[key] = frame
+            self.used += size
+
+            while self.used > self.limit:
+                _, old_frame = self.frames.popitem(last=False)
+                self.used -= sys.getsizeof(old_frame)
+
+    def invalidate(self, file_path):
+        """Drops every frame of a single entry."""
+
+        with self.lock:
+            for key in [key for key in self.frames if key[0] == file_path]:
+                self.used -= sys.getsizeof(self.frames.pop(key))
+
+# The rendered entries shared by every navigation
+FRAME_CACHE = FrameCache(FRAME_CACHE_LIMIT)
+
+# [✅]
+class Prefetcher:
+    """
+    Renders the entries around the one being displayed on a background
+    thread, while we wait for the next key, so stepping to them is instant.
+    Every new request replaces the last one, so a jump or a search cancels
+    whatever was still being prefetched
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        # Bumped on every request, so the thread can tell when its work is stale
+        self.generation = 0
+        self.request = None
+        self.thread = None
+
+    def schedule(self, paths, position, keyword=None):
+        """
+        Asks for the neighbours of an entry to be rendered
+
+        Arguments:
+            paths (list): The file paths being navigated
+            position (int): The index of the current entry inside paths
+            keyword (str): The search keyword the entries are highlighted with
+        """
+
+        with self.condition:
+            self.generation += 1
+            self.request = (self.generation, paths, position, keyword)
+            self.condition.notify()
+
+        # The thread is only started the first time we need it
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def cancel(self):
+        """Stops whatever is being prefetched."""
+
+        with self.condition:
+            self.generation += 1
+            self.request = None
+
+    def run(self):
+        """The background thread, waiting for requests and rendering their entries."""
+
+        while True:
+            with self.condition:
+                while self.request is None:
+                    self.condition.wait()
+                generation, paths, position, keyword = self.request
+                self.request = None
+
+            # The closest entries first, alternating between next and previous
+            for distance in range(1, PREFETCH_DISTANCE + 1):
+                for offset in (-distance, distance):
+                    # A newer request came in, this one is stale
+                    if self.generation != generation or not paths:
+                        break
+
+                    file_path = paths[(position + offset) % len(paths)]
+
+                    # Only entries already in the index, the index is updated by the main thread
+                    if file_path not in load_index(JOURNAL_DIRECTORY)["entries"]:
+                        continue
+
+                    try:
+                        render_dream(file_path, keyword)
+                    except Exception:
+                        # The entry will show its error when it's actually displayed
+                        pass
+
+# The prefetcher shared by every navigation
+PREFETCHER = Prefetcher()
+
+# [✅]
+def peek_entry(file_path):
+    """
+    Gets the parsed header of an entry straight from the index, without
+    checking the file. Entries we edit are updated through get_entry()
+
+    Arguments:
+        file_path (str): The location of the entry
+
+    Returns:
+        The entry's DreamEntry
+    """
+
+    entry = load_index(JOURNAL_DIRECTORY)["entries"].get(file_path)
+    return entry if entry is not None else get_entry(file_path)
+
+# The entry the navigator last checked against its file
+_verified_entry = None
+
+# [✅]
+def verify_entry(file_path):
+    """
+    Checks the entry the navigator is about to show against its file, so an
+    entry changed outside the vault, eg. by another editor or a sync on
+    another machine, is re-read instead of showing its old frame. This is a
+    single stat, done once each time we move to an entry, not every redraw
+
+    Arguments:
+        file_path (str): The location of the entry
+    """
+
+    global _verified_entry
+
+    if file_path != _verified_entry:
+        _verified_entry = file_path
+        # get_entry() re-reads the header if the mtime or size changed, which also changes our frame's key
+        get_entry(file_path)
+
+# [✅]
+def render_dream(file_path, searchWord):
+    """
+    Renders an entry into the frame we display, reusing the cached frame
+    if the entry hasn't changed, so flipping between entries costs no reads
+
+    Arguments:
+        file_path (str): The files path, so that we can read it
+        searchWord (str): A word we want to highlight (search function)
+
+    Returns:
+        The rendered entry, as a single string
+    """
+
+    # The parsed header, from the index
+    entry = peek_entry(file_path)
+
+    key = (file_path, entry.mtime, entry.size, searchWord or None)
+    frame = FRAME_CACHE.get(key)
+    if frame is not None:
+        return frame
+
+    lines = []
+
+    # We must check if it has a valid date, we'll display the error to the user, so that they can fix it
+    if entry.date == DIRTY_ORDINAL:
+        lines.append(f"{Color.RED}Malformed Date!:\n1. Change Date To A Valid: [Day Month, Year]\n2. Use 'r' Command To Refresh\n3. Error Should Be Resolved{Color.END}")
+        lines.append("───────────────────────────────────────────────────────────────────────")
+
+    # The search highlighting is compiled once for the whole entry
+    highlighter = RENDERER.highlighter(searchWord)
+
+    with open_entry(file_path) as file:
+        for i, line in enumerate(file):
+            # Coloring the line in a single pass
+            lines.append(RENDERER.render_line(i, line, highlighter))
+
+    frame = "\n".join(lines)
+    FRAME_CACHE.put(key, frame)
+    return frame
+
+# [✅]
+class LineIndex:
+    """
+    The byte offsets of where every line of an entry starts, found lazily,
+    we only ever read as far as the lines we've been asked for, so the start
+    of a huge entry costs the same as the start of a small one. Lines longer
+    than VIEWPORT_LINE_LIMIT are split, so a single line can't fill the screen
+    """
+
+    def __init__(self, file_path, mtime, size):
+        self.file_path = file_path
+        self.mtime = mtime
+        self.size = size
+
+        # The start of every line found so far, the last offset is where we stopped looking
+        self.offsets = array('Q', (0,))
+        self.complete = size == 0
+
+    def scan(self, count):
+        """Finds where lines start until we know the first count lines, or reach the end."""
+
+        if self.complete or len(self.offsets) > count:
+            return
+
+        position = self.offsets[-1]
+        pending = b''
+
+        while len(self.offsets) <= count:
+            chunk = read_entry_range(self.file_path, position + len(pending), VIEWPORT_CHUNK)
+            if not chunk:
+                # The last line has no newline
+                if pending:
+                    self.offsets.append(position + len(pending))
+                self.complete = True
+                return
+
+            pending += chunk
+            start = 0
+            while len(self.offsets) <= count:
+                end = pending.find(b'\n', start, start + VIEWPORT_LINE_LIMIT)
+                if end >= 0:
+                    start = end + 1
+                elif len(pending) - start > VIEWPORT_LINE_LIMIT:
+                    # Splitting a long line, but never inside of a character
+                    cut = start + VIEWPORT_LINE_LIMIT
+                    while cut > start + 1 and 0x80 <= pending[cut] < 0xC0:
+                        cut -= 1
+                    start = cut
+                else:
+                    break
+                self.offsets.append(position + start)
+
+            position += start
+            pending = pending[start:]
+
+            # We reached the end, and the file ended with a newline
+            if position == self.size and not pending:
+                self.complete = True
+                return
+
+    def lines(self, start, count):
+        """Reads up to count lines, from line start."""
+
+        self.scan(start + count)
+        stop = min(start + count, len(self.offsets) - 1)
+        if start >= stop:
+            return []
+
+        data = read_entry_range(self.file_path, self.offsets[start], self.offsets[stop] - self.offsets[start])
+
+        base = self.offsets[start]
+        return [
+            str(data[self.offsets[i] - base:self.offsets[i + 1] - base], 'utf-8', 'replace')
+            for i in range(start, stop)
+        ]
+
+    def total(self):
+        """The number of lines, None if we haven't looked through the whole entry yet."""
+        return len(self.offsets) - 1 if self.complete else None
+
+# The line-offset indexes of the entries we've viewed, {file_path: LineIndex}
+_line_indexes = OrderedDict()
+
+# [✅]
+def render_window(file_path, top, height, searchWord):
+    """
+    Renders only the lines of an entry that fit inside the viewport
+
+    Arguments:
+        file_path (str): The files path, so that we can read it
+        top (int): The first line we want to see
+        height (int): The rows we have to fill
+        searchWord (str): A word we want to highlight (search function)
+
+    Returns:
+        The rendered lines, as a single string, how many lines are shown,
+        and the number of lines in the entry, None if it isn't known yet
+    """
+
+    entry = peek_entry(file_path)
+
+    # Reusing our line offsets, unless the entry has changed
+    line_index = _line_indexes.pop(file_path, None)
+    if line_index is None or (line_index.mtime, line_index.size) != (entry.mtime, entry.size):
+        line_index = LineIndex(file_path, entry.mtime, entry.size)
+    _line_indexes[file_path] = line_index
+    while len(_line_indexes) > VIEWPORT_INDEX_LIMIT:
+        _line_indexes.popitem(last=False)
+
+    highlighter = RENDERER.highlighter(searchWord)
+    columns = shutil.get_terminal_size().columns
+
+    lines = []
+    rows = 0
+
+    # Every line takes up at least a row, so we never need more lines than rows
+    for i, line in enumerate(line_index.lines(top, max(height, 1)), top):
+        rendered = RENDERER.render_line(i, line, highlighter)
+        needed = SCREEN.rows(rendered, columns)
+
+        # The last line only shows what fits, it's seen whole once we scroll to it
+        if rows + needed > height and lines:
+            if height - rows > 0:
+                lines.append(RENDERER.render_line(i, line.strip()[:(height - rows) * columns], highlighter))
+            break
+
+        rows += needed
+        lines.append(rendered)
+
+    return "\n".join(lines), len(lines), line_index.total()
+
+# [✅]
+def display_dream(file_path, openEditor, returnDate, searchWord):
+    """
+    A function that displays a dream to the console
+
+    Arguments:
+        file_path (str): The files path, so that we can read it
+        openEditor (str): If we want to edit the file or not
+        returnDate (bool): If we want to only return the date
+        searchWord (str): A word we want to highlight (search function)
+        
+    Returns:
+        True is everything was displayed correctly, False if an error occured
+    """
+
+    try:
+        # If editor is False, read it to the console only
+        if openEditor == False:
+            # If we only want the date, return it [formatting]
+            if returnDate:
+                return peek_entry(file_path).raw_date
+
+            # Otherwise, normally print to the screen
+            print(render_dream(file_path, searchWord))
+            return True
+
+        # If editor is True, let's open it with our text editor
+        else:
+            # Remembering the entry as it was, in case it was changed outside of the vault
+            record_revision(file_path, read_entry(file_path))
+
+            # A stored entry is edited as a file, and then moved back
+            checkout_entry(file_path)
+            subprocess.run(TEXT_EDITOR + [file_path])
+            commit_entry(file_path)
+
+            # Every save is a revision
+            record_revision(file_path, read_entry(file_path))
+
+            # Updating our index and statistics with the edited entry, and dropping its old frames
+            get_entry(file_path)
+            FRAME_CACHE.invalidate(file_path)
+            return True
+
+    # If an error occurs print it, log it, and then return False
+    except Exception as e:
+        log("Unknown Error", e)
+        print(f"{Color.RED}Error! {e}{Color.END}")
+        return False
+
+# [✅]
+class Screen:
+    """
+    Draws the frames of the navigator without clearing the terminal. A frame
+    is everything printed inside a 'with SCREEN:' block, it's compared with the
+    frame on screen, and only the lines that changed are written, using ANSI
+    escape sequences to move the cursor. Anything else that writes to the
+    terminal, eg. input(), has to invalidate() the screen
+    """
+
+    # Escape sequences take up no room on screen
+    ESCAPE_PATTERN = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+    def __init__(self):
+        # The (line, rows) of the frame on screen, None if it has to be fully redrawn
+        self.lines = None
+        self.buffer = None
+        self.stdout = None
+
+    def invalidate(self):
+        """The terminal was written to, the next frame is drawn from scratch."""
+        self.lines = None
+
+    def begin(self):
+        """Starts a frame, everything printed is held until end()."""
+
+        if self.buffer is None:
+            self.stdout = sys.stdout
+            self.buffer = io.StringIO()
+            sys.stdout = self.buffer
+
+        print(PROGRAM_NAME)
+
+    def end(self):
+        """Finishes a frame, and draws it."""
+
+        if self.buffer is None:
+            return
+
+        text = self.buffer.getvalue()
+        sys.stdout = self.stdout
+        self.buffer = None
+
+        self.stdout.write(self.draw(text.split("\n")))
+        self.stdout.flush()
+
+    def abort(self):
+        """Stops a frame without drawing it, what was printed is written as is."""
+
+        if self.buffer is None:
+            return
+
+        text = self.buffer.getvalue()
+        sys.stdout = self.stdout
+        self.buffer = None
+
+        self.invalidate()
+        self.stdout.write(text)
+        self.stdout.flush()
+
+    def __enter__(self):
+        self.begin()
+        return self
+
+    def __exit__(self, kind, error, traceback):
+        # If building the frame failed, our output still has to go back to the terminal
+        if kind is None:
+            self.end()
+        else:
+            self.abort()
+        return False
+
+    def rows(self, line, columns):
+        """The number of rows a line takes up once it wraps."""
+        return max(1, -(-len(self.ESCAPE_PATTERN.sub('', line)) // columns))
+
+    def draw(self, lines):
+        """
+        Builds the output that turns the frame on screen into a new one
+
+        Arguments:
+            lines (list): The lines of the new frame
+
+        Returns:
+            The text to write to the terminal
+        """
+
+        columns, height = shutil.get_terminal_size()
+        frame = [(line, self.rows(line, columns)) for line in lines]
+
+        # A frame taller than the terminal scrolls it, so we can't tell where our lines are
+        if self.lines is None or sum(rows for _, rows in frame) >= height:
+            self.lines = frame if sum(rows for _, rows in frame) < height else None
+            return "\x1b[H\x1b[2J\x1b[3J" + "\n".join(lines)
+
+        output = []
+        row = 1
+
+        for i, (line, rows) in enumerate(frame):
+            # The last line is always rewritten, so the cursor ends up after it
+            if i < len(self.lines) and self.lines[i] == (line, rows) and i < len(frame) - 1:
+                row += rows
+                continue
+
+            output.append(f"\x1b[{row};1H")
+
+            # The line changed size, so every line after it has moved, we draw them all
+            if i >= len(self.lines) or self.lines[i][1] != rows:
+                output.append("\x1b[J" + "\n".join(lines[i:]))
+                break
+
+            # A line that fills its last row needs no clearing, the cursor is still on that row
+            width = len(self.ESCAPE_PATTERN.sub('', line))
+            output.append(line if width and width % columns == 0 else line + "\x1b[K")
+            row += rows
+
+        # Clearing whatever the old frame had below the new one
+        output.append("\x1b[J")
+
+        self.lines = frame
+        return "".join(output)
+
+# The screen the navigator draws on
+SCREEN = Screen()
+
+# [X]
+def getch(timeout=None):
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setraw(sys.stdin.fileno())
+        # Nothing was pressed in time
+        if timeout is not None and not select.select([sys.stdin], [], [], timeout)[0]:
+            return ''
+        ch = sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    return ch
+
+# [✅]
+def navigate():
+    """
+    A function that can navigate through every dream inside our journal,
+    using CLI, and certain commands the user can use. Moreover, the 
+    navigation is wrapped, meaning that if we are at the end, we'll wrap
+    to the start again, hence we cannot crash this function.
+
+    Commands:
+        [n]ext: Go to the next file
+        [p]revious: Go to the previous file
+        [e]dit: Edit the current file
+        [d]elete: Delete the current file
+        [r]efresh: Refresh the current file
+        [i]ndex: Change index
+        [g]oto: Go to a date, YYYY, YYYY/MM, or YYYY/MM/DD
+        [f]ilter: Only show entries with certain header fields
+        [v]iew: Toggle the viewport, only showing what fits on screen, [j]/[k] scroll it
+        [t]op: Ranked search, with phrases and AND/OR/NOT
+        [h]istory: Look through the revisions of the current file, diff or restore them
+        [c]lear logs: Clear local logs
+        [q]uit: Quit navigation
+
+    Returns:
+        Nothing
+    """
+
+    # A variable to store all our local error logs
+    error_log = []
+
+    # The files inside of our journal directory [Newest -> Oldest], they're
+    # listed in the background, so we can show the newest dream right away
+    listing = JournalListing(JOURNAL_DIRECTORY)
+    dream_files = listing.paths
+
+    # There are no files, let's display that we don't have any entries
+    listing.wait_for(1)
+    if not dream_files:
+        print(f"\n{Color.YELLOW}No Dream Entries Found!{Color.END}\n")
+        return
+
+    # Index to keep track of what file we are looking at currently, 0 is the newest
+    index = 0
+
+    # If we're only showing what fits on screen, the first line we show, and the entry it's for
+    viewport = False
+    top = 0
+    viewing = None
+
+    # The number of lines the viewport showed, and the entry's total [None until it's been fully read]
+    view_shown = 0
+    view_total = None
+
+    # Starting from a clear screen
+    SCREEN.invalidate()
+
+    # Main display loop
+    while True:
+
+        # Let's first start a new frame, only the lines that change are redrawn
+        with SCREEN:
+
+            # Let's check if we have a negative index, wrap around to the oldest
+            if index < 0:
+                listing.wait()
+                index = len(dream_files) - 1
+
+            # Otherwise, if it's greater than the amount of files we have, wrap around to the newest
+            elif index >= len(dream_files):
+                index = 0
+
+            # Dream Count Display, the oldest dream is 1, so we need the full count for our number
+            if listing.done.is_set():
+                dream_count = f"{len(dream_files) - index}/{len(dream_files)}"
+            else:
+                dream_count = f"?/{len(dream_files)}+"
+
+            # A new entry is always viewed from the top
+            if viewing != dream_files[index]:
+                viewing = dream_files[index]
+                top = 0
+
+            # Making sure the entry wasn't changed outside the vault
+            verify_entry(dream_files[index])
+
+            print(f"{Color.BLUE}Dream: [{dream_count}]{Color.END} | {Color.BLUE}{peek_entry(dream_files[index]).raw_date}{Color.END} | @ {dream_files[index]}\n\n───────────────────────────────────────────────────────────────────────")
+
+            if viewport:
+                # Display only the lines of the dream that fit, leaving room for our errors
+                height = shutil.get_terminal_size().lines - VIEWPORT_MARGIN - sum(item.count("\n") + 1 for item in error_log)
+                try:
+                    window, view_shown, view_total = render_window(dream_files[index], top, height, False)
+                    print(window)
+                    print(f"{Color.BLUE}Lines: [{top + 1}-{top + view_shown}/{view_total if view_total is not None else '?'}]{Color.END}")
+                except OSError as e:
+                    log("Unknown Error", e)
+                    error_log.append((f"\n{Color.RED}Failed To Display Entry!{Color.END}: [{dream_files[index]}]\n"))
+                    view_shown, view_total = 0, 0
+            else:
+                # Display the latest dream
+                display_attempt = display_dream(dream_files[index], False, False, False)
+                if not display_attempt:
+                    error_log.append((f"\n{Color.RED}Failed To Display Entry!{Color.END}: [{dream_files[index]}]\n"))
+
+            # Displaying errors in the local log
+            if SHOW_ERRORS_NAV:
+                for item in error_log:
+                    print(item)
+    
+            # Command prompt
+            print("───────────────────────────────────────────────────────────────────────\n")
+            print(f"{Color.GREEN}Commands: [n]ext, [p]revious, [e]dit, [d]elete, [r]efresh, [s]earch, [t]op, [i]ndex, [g]oto, [f]ilter, [h]istory, [v]iew{', [j]/[k] scroll' if viewport else ''}, [c]lear logs, [q]uit{Color.END}")
+        
+            # Rendering the neighbouring entries while we wait for a key
+            PREFETCHER.schedule(dream_files, index)
+
+        # Read single character input without requiring Enter
+        command = getch().lower()
+
+        # Commands other than moving, scrolling, or clearing logs, can write to the terminal themselves
+        if command not in ('n', 'p', 'j', 'k', 'v', 'c'):
+            SCREEN.invalidate()
+
+        # If the user wants to go next
+        if command == 'n':
+            # Go to an older dream, waiting for it to be listed if we need to
+            index += 1
+            listing.wait_for(index + 1)
+        elif command == 'p':
+            # Go to a newer dream, the top of the loop wraps around
+            index -= 1
+        elif command == 'e':
+            # Nothing should be prefetched while the entry is being edited
+            PREFETCHER.cancel()
+
+            # Display our dream, with editing on
+            display_dream(dream_files[index], True, False, False) 
+        elif command == 'd':
+            # Delete a dream entry
+            if CAN_DELETE == True:
+                # Our list of files is about to change
+                PREFETCHER.cancel()
+
+                delete_entry(dream_files[index])
+
+                # Update list of files after deletion
+                listing.remove(dream_files[index])
+                listing.wait_for(index + 1)
+
+                # If there are no dream files, throw an error
+                if not dream_files:
+                    print(f"\n{Color.YELLOW}No Dream Entries Found!{Color.END}\n")
+                    break
+                # Otherwise, if the length is greater, decrement it
+                elif index >= len(dream_files):
+                    index = 0
+            else:
+                error_log.append((f"{Color.RED}Deleting Dreams is Disabled\nUse 'toggle_del' command to change.{Color.END}"))
+
+        # If the command is to search, we'll start searching
+        elif command == 's':                
+            # The entries around us aren't needed while we search
+            PREFETCHER.cancel()
+
+            # Prompt the user for a search keyword
+            search_keyword = input("Search keyword: ").strip()
+
+            # The files that match the search phrase along with their original index, they're
+            # found in the background, so we can step through them while the search continues
+            scan = SearchScan(listing, search_keyword)
+            matching_files = scan.results
+
+            # New search-based navigation
+            search_index = 0
+
+            # What our screen last showed, we only redraw it when that changes
+            shown = None
+
+            while True:
+                finished = scan.done.is_set()
+
+                # If no matches found, log an error
+                if finished and not matching_files:
+                    print(f"{Color.RED}No Matches For: {search_keyword}{Color.END}")
+                    time.sleep(1)
+                    SCREEN.invalidate()
+                    break
+
+                if shown != (search_index, len(matching_files), finished):
+                    shown = (search_index, len(matching_files), finished)
+
+                    # Start a new frame
+                    with SCREEN:
+
+                        # The total is unknown until our search has finished
+                        total = len(matching_files) if finished else "?"
+
+                        if not matching_files:
+                            print(f"{Color.BLUE}Search Results: [0/?]{Color.END} | Searching For: {search_keyword}...")
+                        else:
+                            # The original index counts from the oldest, so it needs every dream listed
+                            file_path, position = matching_files[search_index]
+                            verify_entry(file_path)
+                            dream_index = len(dream_files) - position if listing.done.is_set() else "?"
+
+                            # Display the search results and current file
+                            print(f"{Color.BLUE}Search Results: [{search_index + 1}/{total}]{Color.END} | {Color.BLUE}{peek_entry(file_path).raw_date}{Color.END} | {Color.GREEN}Index: {dream_index}{Color.END} | @ {file_path}\n\n───────────────────────────────────────────────────────────────────────")
+
+                            # Show the content of the currently selected dream
+                            display_attempt = display_dream(file_path, False, False, search_keyword)
+                            if not display_attempt:
+                                error_log.append((f"\n{Color.RED}Failed To Display Entry!{Color.END}: [{matching_files[search_index]}]\n"))
+
+                            # Rendering the neighbouring results while we wait for a key
+                            PREFETCHER.schedule([file_path for file_path, _ in matching_files], search_index, search_keyword)
+
+                        # Displaying errors in the local log
+                        if SHOW_ERRORS_NAV:
+                            for item in error_log:
+                                print(item)
+
+                        # Command prompt for the search navigation
+                        print("───────────────────────────────────────────────────────────────────────\n")
+                        print(f"{Color.GREEN}Commands: [n]ext, [p]revious, [b]ack{Color.END}")
+
+                # Read single character input, while searching we stop waiting now and then to update the results
+                search_command = getch(None if finished else SEARCH_REFRESH_SECONDS).lower()
+
+                if not search_command:
+                    continue
+                elif search_command == 'n':
+                    # Move to the next matching file, we can only wrap once we've found them all
+                    if search_index + 1 < len(matching_files):
+                        search_index += 1
+                    elif finished:
+                        search_index = 0
+                elif search_command == 'p':
+                    # Move to the previous matching file
+                    if search_index > 0:
+                        search_index -= 1
+                    elif finished:
+                        search_index = len(matching_files) - 1
+                elif search_command == 'e':
+                    # Edit the current file
+                    print("Disabled...")
+                    # display_dream(matching_files[search_index], True, False, False)
+                elif search_command == 'b':
+                    # Stop searching, and return to the main navigation
+                    scan.cancel()
+                    SCREEN.invalidate()
+                    break
+                else:
+                    # Invalid command handling
+                    error_log.append((f"\n{Color.RED}Unknown Command{Color.END}: [{search_command}]\n"))
+                    shown = None
+
+        # If the command is a ranked search, we'll navigate the best matches first
+        elif command == 't':
+            # The entries around us aren't needed while we search
+            PREFETCHER.cancel()
+
+            # Prompt the user for a query
+            search_query = input("Ranked search: ").strip()
+
+            # Gather the best matching files along with their scores, and what we'll highlight
+            ranked_files, highlights = rank_entries(search_query)
+
+            # If no matches found, log an error
+            if not ranked_files:
+                print(f"{Color.RED}No Matches For: {search_query}{Color.END}")
+                time.sleep(1)
+
+            # New ranked navigation
+            ranked_index = 0
+
+            # The paths of our results, used by the prefetcher
+            ranked_paths = [file_path for file_path, _ in ranked_files]
+
+            while ranked_files:
+                # Start a new frame
+                with SCREEN:
+
+                    # Display the ranked results and current file
+                    verify_entry(ranked_files[ranked_index][0])
+                    print(f"{Color.BLUE}Ranked Results: [{ranked_index + 1}/{len(ranked_files)}]{Color.END} | {Color.BLUE}{peek_entry(ranked_files[ranked_index][0]).raw_date}{Color.END} | {Color.GREEN}Score: {ranked_files[ranked_index][1]:.2f}{Color.END} | @ {ranked_files[ranked_index][0]}\n\n───────────────────────────────────────────────────────────────────────")
+
+                    # Show the content of the currently selected dream
+                    display_attempt = display_dream(ranked_files[ranked_index][0], False, False, highlights)
+                    if not display_attempt:
+                        error_log.append((f"\n{Color.RED}Failed To Display Entry!{Color.END}: [{ranked_files[ranked_index]}]\n"))
+
+                    # Displaying errors in the local log
+                    if SHOW_ERRORS_NAV:
+                        for item in error_log:
+                            print(item)
+
+                    # Command prompt for the ranked navigation
+                    print("───────────────────────────────────────────────────────────────────────\n")
+                    print(f"{Color.GREEN}Commands: [n]ext, [p]revious, [b]ack{Color.END}")
+
+                    # Rendering the neighbouring results while we wait for a key
+                    PREFETCHER.schedule(ranked_paths, ranked_index, highlights)
+
+                # Read single character input
+                ranked_command = getch().lower()
+
+                if ranked_command == 'n':
+                    # Move to the next best file
+                    ranked_index = (ranked_index + 1) % len(ranked_files)
+                elif ranked_command == 'p':
+                    # Move to the previous file
+                    ranked_index = (ranked_index - 1) % len(ranked_files)
+                elif ranked_command == 'b':
+                    # Return to the main navigation
+                    break
+                else:
+                    # Invalid command handling
+                    error_log.append((f"\n{Color.RED}Unknown Command{Color.END}: [{ranked_command}]\n"))
+
+        # If the command is to filter, we'll only navigate the entries with the header fields we want
+        elif command == 'f':
+            # The entries around us aren't needed while we filter
+            PREFETCHER.cancel()
+
+            # Prompt the user for the values of each field, blank fields aren't filtered
+            filters = {}
+            for field, (_, label) in HEADER_FIELDS.items():
+                values = [value.strip() for value in input(f"{label} ").split(",") if value.strip()]
+                if values:
+                    filters[field] = values
+
+            # Gather the matching files, in the order we're navigating them, along with their original index
+            listing.wait()
+            matching_paths = filter_entries(load_index(JOURNAL_DIRECTORY), filters)
+            filtered_files = [(file_path, position) for position, file_path in enumerate(dream_files) if file_path in matching_paths]
+
+            # If no matches found, log an error
+            if not filtered_files:
+                print(f"{Color.RED}No Matches For Filter!{Color.END}")
+                time.sleep(1)
+
+            # New filter-based navigation
+            filter_index = 0
+
+            # The paths of our results, used by the prefetcher
+            matching_paths = [file_path for file_path, _ in filtered_files]
+
+            while filtered_files:
+                # Start a new frame
+                with SCREEN:
+
+                    # Display the filter results and current file
+                    verify_entry(filtered_files[filter_index][0])
+                    print(f"{Color.BLUE}Filter Results: [{filter_index + 1}/{len(filtered_files)}]{Color.END} | {Color.BLUE}{peek_entry(filtered_files[filter_index][0]).raw_date}{Color.END} | {Color.GREEN}Index: {len(dream_files) - filtered_files[filter_index][1]}{Color.END} | @ {filtered_files[filter_index][0]}\n\n───────────────────────────────────────────────────────────────────────")
+
+                    # Show the content of the currently selected dream
+                    display_attempt = display_dream(filtered_files[filter_index][0], False, False, False)
+                    if not display_attempt:
+                        error_log.append((f"\n{Color.RED}Failed To Display Entry!{Color.END}: [{filtered_files[filter_index]}]\n"))
+
+                    # Displaying errors in the local log
+                    if SHOW_ERRORS_NAV:
+                        for item in error_log:
+                            print(item)
+
+                    # Command prompt for the filter navigation
+                    print("───────────────────────────────────────────────────────────────────────\n")
+                    print(f"{Color.GREEN}Commands: [n]ext, [p]revious, [o]pen, [b]ack{Color.END}")
+
+                    # Rendering the neighbouring results while we wait for a key
+                    PREFETCHER.schedule(matching_paths, filter_index, False)
+
+                # Read single character input
+                filter_command = getch().lower()
+
+                if filter_command == 'n':
+                    # Move to the next matching file
+                    filter_index = (filter_index + 1) % len(filtered_files)
+                elif filter_command == 'p':
+                    # Move to the previous matching file
+                    filter_index = (filter_index - 1) % len(filtered_files)
+                elif filter_command == 'o':
+                    # Return to the main navigation, on the current file
+                    index = filtered_files[filter_index][1]
+                    break
+                elif filter_command == 'b':
+                    # Return to the main navigation
+                    break
+                else:
+                    # Invalid command handling
+                    error_log.append((f"\n{Color.RED}Unknown Command{Color.END}: [{filter_command}]\n"))
+
+        # If the command is to look through the history of the current entry
+        elif command == 'h':
+            # The entries around us aren't needed while we look through revisions
+            PREFETCHER.cancel()
+
+            file_path = dream_files[index]
+
+            # The revisions of our entry [Newest -> Oldest]
+            revisions = list(reversed(entry_revisions(file_path)))
+
+            if not revisions:
+                print(f"{Color.YELLOW}No Revisions For This Entry!{Color.END}")
+                time.sleep(1)
+
+            # New history navigation, showing the diff against the current entry, or the whole revision
+            history_index = 0
+            show_diff = True
+
+            while revisions:
+                # Start a new frame
+                with SCREEN:
+
+                    digest, saved = revisions[history_index]
+                    saved = datetime.fromtimestamp(saved).strftime("%Y-%m-%d %H:%M:%S")
+
+                    # Display the revision we're looking at
+                    print(f"{Color.BLUE}Revision: [{len(revisions) - history_index}/{len(revisions)}]{Color.END} | {Color.BLUE}{saved}{Color.END} | {Color.GREEN}{digest[:12]}{Color.END} | @ {file_path}\n\n───────────────────────────────────────────────────────────────────────")
+
+                    try:
+                        data = load_revision(digest)
+                        if show_diff:
+                            lines = diff_revision(data, read_entry(file_path))
+                            print("\n".join(lines) if lines else f"{Color.GRAY}No Changes Since This Revision{Color.END}")
+                        else:
+                            print(data.decode('utf-8', 'replace'))
+                    except (OSError, ValueError, zlib.error) as e:
+                        log("Unknown Error", e)
+                        error_log.append((f"\n{Color.RED}Failed To Load Revision!{Color.END}: [{digest}]\n"))
+
+                    # Displaying errors in the local log
+                    if SHOW_ERRORS_NAV:
+                        for item in error_log:
+                            print(item)
+
+                    # Command prompt for the history navigation
+                    print("───────────────────────────────────────────────────────────────────────\n")
+                    print(f"{Color.GREEN}Commands: [n]ext [older], [p]revious [newer], [d]iff / full text, [r]estore, [b]ack{Color.END}")
+
+                # Read single character input
+                history_command = getch().lower()
+
+                if history_command == 'n':
+                    # Move to an older revision
+                    history_index = (history_index + 1) % len(revisions)
+                elif history_command == 'p':
+                    # Move to a newer revision
+                    history_index = (history_index - 1) % len(revisions)
+                elif history_command == 'd':
+                    # Switch between the diff and the whole revision
+                    show_diff = not show_diff
+                elif history_command == 'r':
+                    SCREEN.invalidate()
+                    if input(f"Restore this entry to revision {digest[:12]}? (y | n): ") == 'y':
+                        try:
+                            restore_revision(file_path, digest)
+                        except (OSError, ValueError, zlib.error) as e:
+                            log("Unknown Error", e)
+                            error_log.append((f"\n{Color.RED}Failed To Restore Revision!{Color.END}: [{digest}]\n"))
+                        break
+                elif history_command == 'b':
+                    # Return to the main navigation
+                    break
+                else:
+                    # Invalid command handling
+                    error_log.append((f"\n{Color.RED}Unknown Command{Color.END}: [{history_command}]\n"))
+
+        # If the command is to index to a certain dream location
+        elif command == 'i':
+            # We're jumping somewhere else, so our neighbours aren't needed
+            PREFETCHER.cancel()
+
+            # Getting our index location we want to navigate to
+            index_location = input("Enter an index location: ")
+            try:
+                index_location = int(index_location)
+
+                # The oldest dream is 1, so we need every dream listed
+                listing.wait()
+
+                # Check if index_location is within the valid range
+                if 0 <= index_location <= len(dream_files):
+                    # Set our index to the proper location, counting from the oldest
+                    index = len(dream_files) - index_location
+                else:
+                    # Handle invalid index input
+                    error_log.append((f"\n{Color.RED}Invalid Index!{Color.END}: [{index_location}]\n"))
+            except Exception as e:
+                error_log.append((f"\n{Color.RED}Invalid Index!{Color.END}: [{index_location}]\n"))
+        # If the command is to goto, we'll jump to the closest entry to a date
+        elif command == 'g':
+            # We're jumping somewhere else, so our neighbours aren't needed
+            PREFETCHER.cancel()
+
+            # Getting the date we want to navigate to
+            goto_date = input("Enter a date [YYYY, YYYY/MM, YYYY/MM/DD]: ")
+            date_range = parse_goto_date(goto_date)
+
+            if date_range is None:
+                error_log.append((f"\n{Color.RED}Invalid Date!{Color.END}: [{goto_date}]\n"))
+            else:
+                position = listing.find(*date_range)
+                if position is None:
+                    error_log.append((f"\n{Color.RED}No Dated Entries!{Color.END}\n"))
+                else:
+                    index = position
+        # If the command is to toggle the viewport, we'll only show what fits on screen
+        elif command == 'v':
+            viewport = not viewport
+            top = 0
+        # If the command is to scroll down, but not past the last line
+        elif command == 'j' and viewport:
+            if view_total is None or top + view_shown < view_total:
+                top += 1
+        # If the command is to scroll up
+        elif command == 'k' and viewport:
+            top = max(top - 1, 0)
+        # If the command is to refresh, re-read the current entry from disk
+        elif command == 'r':
+            get_entry(dream_files[index])
+            FRAME_CACHE.invalidate(dream_files[index])
+        # If our command is to clear our local logs, set the error_logs to empty
+        elif command == 'c':
+            error_log = []
+        # If the command is to quit, break the navigation loop
+        elif command == 'q':
+            # Nothing else needs to be prefetched
+            PREFETCHER.cancel()
+
+            # Quit the loop
+            break
+        # Otherwise, we have an invalid error, display this
+        else:
+            # Display we have an invalid command
+            error_log.append((f"\n{Color.RED}Unknown Command{Color.END}: [{command}]\n"))
+
+# [✅]
+def parse_sync_entries(file):
+    """
+    Reads entries out of a backup file one at a time, each entry is
+    yielded as soon as its delimiter closes it, so we never hold more
+    than a single entry in memory
+
+    Arguments:
+        file (file): The open backup file
+
+    Yields:
+        A dictionary with the entry's Date, Title, Body, and if it was Deleted
+    """
+
+    # Temporary variable to store the local entry
+    entry = None
+    capture_body = False
+
+    # Loop through every line in our backup
+    for line in file:
+        # Remove leading and trailing spaces
+        line = line.strip()
+
+        # Check if the line starts with our delimiter
+        if line == "==============================":
+            # Check if an entry exists and hand it off
+            if entry and (entry["Body"] or entry["Deleted"]):
+                entry["Body"] = "\n".join(entry["Body"])
+                yield entry
+            # Initialize a new entry, the body is kept as a list of lines
+            entry = {"Date": "", "Title": "", "Body": [], "Deleted": False}
+            capture_body = False
+
+        # If we have an entry
+        elif entry is not None:
+            if line.startswith("[ (") and "|" in line:
+                # Extract title and date
+                parts = line.split("|")
+                entry["Title"] = parts[0].strip("[ (")[:-1].strip()
+                entry["Date"] = parts[1].strip(") ]")[1:].strip()
+            elif line == "[ Deleted Entry ]" and not capture_body:
+                # This entry was deleted after the base backup
+                entry["Deleted"] = True
+            elif line.startswith("───────────────────────────────────────────────────────────────────────"):
+                capture_body = True
+                entry["Body"].append(line)
+            elif capture_body:
+                entry["Body"].append(line)
+
+    # If we have a valid entry at the end of the file, hand it off
+    if entry and (entry["Body"] or entry["Deleted"]):
+        entry["Body"] = "\n".join(entry["Body"])
+        yield entry
+
+# [✅]
+def parse_external_sync_entries(file):
+    """
+    Reads entries out of a file exported by another program, where each
+    entry is a date, a title, and then the body. Like parse_sync_entries(),
+    every entry is yielded as soon as it's closed
+
+    Arguments:
+        file (file): The open sync file
+
+    Yields:
+        A dictionary with the entry's Date, Title and Body
+    """
+
+    entry = None
+
+    # Loop through every line in our sync.txt
+    for line in file:
+        # Remove spaces
+        line = line.strip()
+
+        # Check if the line starts with our delimiter
+        if line.startswith("=============================="):
+
+            # Check if an entry exists, clean up leading/trailing spaces in title and body
+            if entry:
+                entry["Title"] = entry["Title"].strip()
+                entry["Body"] = "\n".join(entry["Body"]).strip()
+                yield entry
+
+            # If we don't have an entry, let's set one up
+            entry = {"Date": "", "Title": "", "Body": []}
+
+        # Otherwise if we have an entry
+        elif entry:
+            # If we don't have a date
+            if not entry["Date"]:
+                # Grab the date
+                entry["Date"] = line.strip()
+            # If we don't have a title
+            elif not entry["Title"]:
+                # Grab the title
+                entry["Title"] = line.strip()
+            # Only add non-empty lines to body
+            elif line:
+                entry["Body"].append(line)
+
+    # If we have a valid entry, clean it up the same way
+    if entry:
+        entry["Title"] = entry["Title"].strip()
+        entry["Body"] = "\n".join(entry["Body"]).strip()
+        yield entry
+
+# [✅]
+class BulkImporter:
+    """
+    Creates synced entries in bulk. Entries are written by a pool of
+    threads, each directory is only created once, and the log lines are
+    written together once the import is done. Entries that are already on
+    disk with the same content are left alone. At most IMPORT_QUEUE_LIMIT
+    entries are ever waiting to be written, so memory stays bounded
+    """
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=IMPORT_WORKERS)
+        # The directories we know exist, so we never check one twice
+        self.directories = set()
+        # Writes that haven't finished yet, in the order we submitted them
+        self.pending = deque()
+        # The latest write of each path, so two writes to one entry never race
+        self.in_flight = {}
+        # How many entries were new, changed, unchanged, skipped, invalid, and deleted
+        self.counts = Counter()
+        # The entries we've written, logged together at the end
+        self.written_paths = {"new": [], "changed": []}
+
+    @staticmethod
+    def write(file_path, content):
+        """
+        Writes a single entry, unless the same entry is already on disk.
+        This runs on our worker threads
+
+        Returns:
+            'new', 'changed', or 'unchanged'
+        """
+
+        data = content.encode('utf-8')
+
+        # Comparing against the entry we already have, the size is checked before the hash
+        try:
+            if stat_entry(file_path).st_size == len(data) and hash_entry(file_path) == hashlib.sha256(data).hexdigest():
+                return "unchanged"
+            status = "changed"
+        except FileNotFoundError:
+            status = "new"
+
+        write_entry(file_path, data)
+
+        return status
+
+    def submit(self, entry):
+        """
+        Validates an entry from parse_sync_entries(), and queues it to be written
+
+        Arguments:
+            entry (dict): The entry's Date, Title, Body, and if it was Deleted
+        """
+
+        # We'll split our date, to check if it is valid
+        try:
+            day, month, year = map(int, date_formatter(entry['Date'], False, False).split('-'))
+        except ValueError:
+            day = month = year = 0
+
+        # Year: 1000 - 3000, Day: 1 - 31, Month: 1 - 12, the same as create_dream()
+        file_path = None
+        if 999 <= year <= 2999 and 1 <= month <= 12 and 1 <= day <= 31:
+            file_path = dream_path(year, month, day, entry['Title'])
+
+        # Make sure we don't have a bad entry
+        if file_path is None:
+            print(f"{Color.RED}Invalid Entry: {entry['Title']}{Color.END}")
+            self.counts["invalid"] += 1
+            return
+
+        # If this entry is still being written, let that write finish first
+        if file_path in self.in_flight:
+            self.in_flight[file_path].exception()
+
+        if entry['Deleted']:
+            # Deleting the entry, if we still have it
+            if entry_exists(file_path):
+                delete_entry(file_path)
+                self.counts["deleted"] += 1
+
+                # Deleting may have removed empty directories
+                day_directory = os.path.dirname(file_path)
+                month_directory = os.path.dirname(day_directory)
+                self.directories.difference_update({day_directory, month_directory, os.path.dirname(month_directory)})
+            return
+
+        # Creating the entry's directories, once per day, a packed journal or database doesn't need them
+        directory = os.path.dirname(file_path)
+        if directory not in self.directories:
+            if entry_store() is None:
+                os.makedirs(directory, exist_ok=True)
+            self.directories.add(directory)
+
+        # The header, and then the content, the same as create_dream()
+        content = f"[ ({entry['Title']}) | ({day} {MONTHS[month]}, {year}) ]\n{entry['Body']}"
+
+        future = self.executor.submit(self.write, file_path, content)
+        self.pending.append((file_path, future))
+        self.in_flight[file_path] = future
+
+        # Waiting on the oldest writes, so we don't hold too many entries
+        while len(self.pending) >= IMPORT_QUEUE_LIMIT:
+            self.finish_one()
+
+    def finish_one(self):
+        """Waits for the oldest pending write, and records what happened."""
+
+        file_path, future = self.pending.popleft()
+        if self.in_flight.get(file_path) is future:
+            del self.in_flight[file_path]
+
+        error = future.exception()
+        if error is not None:
+            print(f"{Color.RED}Error! [{error}]{Color.END}")
+            self.counts["skipped"] += 1
+            return
+
+        status = future.result()
+        self.counts[status] += 1
+
+        # Unchanged entries weren't touched, so their ctime and ordering stay the same
+        if status != "unchanged":
+            # Adding this entry to our index and statistics
+            get_entry(file_path)
+            self.written_paths[status].append(file_path)
+
+    def close(self):
+        """Waits for every write, logs the written entries, and prints a summary."""
+
+        while self.pending:
+            self.finish_one()
+        self.executor.shutdown()
+
+        # Logging every dream entry we wrote to our logs.txt at once
+        log_many("Created Dream @", self.written_paths["new"])
+        log_many("Updated Dream @", self.written_paths["changed"])
+
+        print(f"\n{Color.GREEN}New{Color.END}: {self.counts['new']} | "
+              f"{Color.BLUE}Changed{Color.END}: {self.counts['changed']} | "
+              f"{Color.GRAY}Unchanged{Color.END}: {self.counts['unchanged']} | "
+              f"{Color.YELLOW}Skipped{Color.END}: {self.counts['skipped']} | "
+              f"{Color.RED}Invalid{Color.END}: {self.counts['invalid']} | "
+              f"{Color.RED}Deleted{Color.END}: {self.counts['deleted']}")
+
+# [✅]
+def sync(sync_file=None):
+    """
+    Sync loads a .txt fiFe and reads all the contents. It then
+    turns the text inside the body into a dream journal. There is
+    a specific format to be followed, and this format is used in 'backup()'.
+    Entries marked with '[ Deleted Entry ]' by 'incremental_backup()' are deleted
+
+    Arguments:
+        sync_file (str): The file to sync from, sync.txt if not given
+
+    Returns:
+        Nothing
+    """
+
+    # A count to store how many files we've created, and deleted
+    files_created_count = 0
+    files_deleted_count = 0
+
+    if sync_file is None:
+        sync_file = SYNC_DIRECTORY
+
+    try:
+        # Open our sync.txt, entries are parsed and created as we read them
+        with open_backup(sync_file, 'r') as file:
+
+            if SYNC_EXTERNAL == False:
+                importer = BulkImporter()
+                try:
+                    # Loop through the entries, and hand each one to our importer
+                    for entry in parse_sync_entries(file):
+                        try:
+                            importer.submit(entry)
+                        except Exception as e:
+                            print(f"\n{Color.RED}Syncing Failed! {e}{Color.END}\n")
+                finally:
+                    # Waiting for every write to finish, and showing what we did
+                    importer.close()
+
+                files_created_count = importer.counts["new"] + importer.counts["changed"]
+                files_deleted_count = importer.counts["deleted"]
+            else:
+                # Loop through the entries, and create a journal .txt for each
+                for entry in parse_external_sync_entries(file):
+                    try:
+                        # FIX HERE
+                        year, month, day = date_formatter(entry['Date'], False, False).split('-')
+                        formatted_title = str(entry['Title']).lower().replace(' ', '_')[0:25]
+                        if year == 'DirtyEntry' or month == 'DirtyEntry' or day == 'DirtyEntry':
+                            print(f"Invalid Entry :{entry['Title']}")
+                        else:
+                            log("Creating the dream: ", entry['Title'])
+                            #create_dream(year, month, day, formatted_title, entry['Title'], entry['Body'], False)
+                    except Exception as e:
+                        print(e)
+
+    except Exception as e:
+        print(f"Error? {e}")
+
+    # Log the total files created
+    log("Sync.txt Was Loaded! Files Created", files_created_count)
+    if files_deleted_count:
+        log("Sync.txt Was Loaded! Files Deleted", files_deleted_count)
+
+    # Display that we were able to sync
+    print(f"\n{Color.GREEN}Syncing Was Completed Successfully!{Color.END}\n")
+
+# [✅]
+def open_backup(file_path, mode):
+    """
+    Opens a backup file as text, compressed or not. When writing, the
+    compression is picked from the file's extension, and when reading it's
+    detected from the file's first bytes, so sync.txt can be any backup
+
+    Arguments:
+        file_path (str): The location of the backup file
+        mode (str): 'r' to read the backup, 'w' to write it
+
+    Returns:
+        A text file handle
+    """
+
+    compression = None
+
+    if mode == 'r':
+        # Checking the start of the file for a compression format
+        with open(file_path, 'rb') as file:
+            magic = file.read(6)
+        for name, signature in COMPRESSION_MAGIC.items():
+            if magic.startswith(signature):
+                compression = name
+    else:
+        for name, suffix in COMPRESSION_SUFFIXES.items():
+            if name and file_path.endswith(suffix):
+                compression = name
+
+    if compression == 'gzip':
+        return gzip.open(file_path, mode + 't', encoding='utf-8')
+    elif compression == 'xz':
+        return lzma.open(file_path, mode + 't', encoding='utf-8')
+    else:
+        return open(file_path, mode, encoding='utf-8', buffering=BACKUP_BUFFER_SIZE)
+
+# [✅]
+def write_backup_entry(output_file, entry):
+    """
+    Streams a single entry into a backup file, followed by the delimiter
+
+    Arguments:
+        output_file (file): The open backup file
+        entry (DreamEntry): The entry we want to back up
+
+    Returns:
+        True if the entry was written, False if it was skipped
+    """
+
+    # The header was already parsed, skip entries without a date
+    if entry.raw_date == 'DirtyEntry':
+        return False
+
+    output_file.write(f"[ ({entry.title}) | {entry.raw_date} ]\n")
+
+    with open_entry(entry.path) as file:
+        # Skipping the header line, we've already formatted it
+        file.readline()
+        # Copying the rest in chunks, so we never hold the whole entry
+        shutil.copyfileobj(file, output_file)
+
+    output_file.write("\n==============================\n")
+    return True
+
+# [✅]
+def backup_file_path(kind):
+    """
+    Creates a new timestamped backup file path
+
+    Arguments:
+        kind (str): The kind of backup, 'Backup' for full backups or 'Delta' for incremental ones
+
+    Returns:
+        The path of the backup file inside our backups directory
+    """
+
+    timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")  # Adjusted timestamp format
+    backup_file_name = f"[{timestamp}]_Dream_{kind}.txt{COMPRESSION_SUFFIXES[BACKUP_COMPRESSION]}"
+    return os.path.join(BACKUP_DIRECTORY, backup_file_name)
+
+# [✅]
+def hash_entry(file_path):
+    """
+    Hashes the content of an entry, used to tell which entries changed between backups
+
+    Arguments:
+        file_path (str): The location of the entry
+
+    Returns:
+        The sha256 hex digest of the entry
+    """
+
+    # A packed entry is hashed straight from its slice
+    store = entry_store()
+    if store is not None:
+        return hashlib.sha256(store.get(file_path)).hexdigest()
+
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# [✅]
+def load_manifest():
+    """
+    Loads the backup manifest, which remembers the base backup, its deltas,
+    and the hash of every entry as of the last backup
+
+    Returns:
+        The manifest, or None if we haven't made a full backup yet
+    """
+
+    try:
+        with open(BACKUP_MANIFEST, 'r') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+# [✅]
+def save_manifest(manifest):
+    """
+    Writes the backup manifest, through a temporary file
+
+    Arguments:
+        manifest (dict): The manifest we want to save
+    """
+
+    temporary_path = BACKUP_MANIFEST + '.tmp'
+    with open(temporary_path, 'w') as file:
+        json.dump(manifest, file, separators=(',', ':'))
+    os.replace(temporary_path, BACKUP_MANIFEST)
+
+# [✅]
+def manifest_entries(dream_entries, previous):
+    """
+    Builds the manifest records of our entries, we only hash the entries
+    that changed since the previous manifest
+
+    Arguments:
+        dream_entries (list): The DreamEntry's we're backing up
+        previous (dict): The records of the previous manifest
+
+    Returns:
+        A dictionary of {file_path: record}
+    """
+
+    records = {}
+    for entry in dream_entries:
+        # Entries without a date are never backed up
+        if entry.raw_date == 'DirtyEntry':
+            continue
+
+        record = previous.get(entry.path)
+        if record is None or record["mtime"] != entry.mtime or record["size"] != entry.size:
+            record = {
+                "hash": hash_entry(entry.path),
+                "mtime": entry.mtime,
+                "size": entry.size,
+                "title": entry.title,
+                "date": entry.raw_date,
+            }
+        records[entry.path] = record
+
+    return records
+
+# [✅]
+def write_full_backup():
+    """
+    Writes every entry into a new backup file, and makes it the base of our manifest
 
     Returns:
-        Nothing
+        The path of the backup file
     """
 
-    # A count to store how many files we've created
-    files_created_count = 0
+    # Let us get all the dream entries
+    dream_entries = list_entries(JOURNAL_DIRECTORY)
 
-    try:
-        # Open our sync.txt and read its contents
-        with open(SYNC_DIRECTORY, 'r') as file:
-            content = file.readlines()
-
-        # Variable to store all entries in an organized manner
-        organized_entries = []
-
-        # Temporary variable to store the local entry
-        entry = None
-        capture_body = False
-
-        if SYNC_EXTERNAL == False:
-            # Loop through every line in our sync.txt
-            for line in content:
-                # Remove leading and trailing spaces
-                line = line.strip()
-
-                # Check if the line starts with our delimiter
-                if line == "==============================":
-                    # Check if an entry exists and append it to organized_entries
-                    if entry and entry["Body"]:
-                        organized_entries.append(entry)
-                    # Initialize a new entry
-                    entry = {"Date": "", "Title": "", "Body": ""}
-                    capture_body = False
-
-                # If we have an entry
-                elif entry is not None:
-                    if line.startswith("[ (") and "|" in line:
-                        # Extract title and date
-                        parts = line.split("|")
-                        entry["Title"] = parts[0].strip("[ (")[:-1].strip()
-                        entry["Date"] = parts[1].strip(") ]")[1:].strip()
-                    elif line.startswith("───────────────────────────────────────────────────────────────────────"):
-                        capture_body = True
-                        if entry["Body"]:
-                            entry["Body"] += "\n"
-                        entry["Body"] += line
-                    elif capture_body:
-                        if entry["Body"]:
-                            entry["Body"] += "\n"
-                        entry["Body"] += line
-
-            # If we have a valid entry at the end of the file, append it to organized_entries
-            if entry and entry["Body"]:
-                organized_entries.append(entry)
-
-            # Loop through the entries, and create a journal .txt for each
-            for entry in organized_entries:
-                try:
-                    # We'll split our date, to check if it is valid
-                    day, month, year = date_formatter(entry['Date'], False, False).split('-')
-                    # Make sure we don't have a bad entry
-                    if year == 'DirtyEntry' or month == 'DirtyEntry' or day == 'DirtyEntry':
-                        print(f"{Color.RED}Invalid Entry: {entry['Title']}{Color.END}")
-                    else:
-                        # If everything is valid, let's create our dream
-                        create_dream(year, month, day, entry['Title'], entry['Body'], True)
-                        # Add it to the total
-                        files_created_count += 1
-                except Exception as e:
-                    print(f"\n{Color.RED}Syncing Failed! {e}{Color.END}\n")
-        else:
-            # Loop through every line in our sync.txt
-            for line in content:
-                # Remove spaces
-                line = line.strip()
-
-                # Check if the line starts with our delimiter
-                if line.startswith("=============================="):
-
-                    # Check if an entry exists
-                    if entry:
-                        # Clean up leading/trailing spaces in title and body
-                        if "Title" in entry:
-                            # Title, Date, and then the rest is the body
-                            entry["Title"] = entry["Title"].strip()
-                            entry["Body"] = entry["Body"].strip()
-                            organized_entries.append(entry)
-
-                    # If we don't have an entry, let's set one up
-                    entry = {"Date": "", "Title": "", "Body": ""}
-                
-                # Otherwise if we have an entry
-                elif entry:
-                    # If we don't have a date
-                    if not entry["Date"]:
-                        # Grab the date
-                        entry["Date"] = line.strip()
-                    # If we don't have a title
-                    elif not entry["Title"]:
-                        # Grab the title
-                        entry["Title"] = line.strip()
-                    # Otherwise
-                    else:
-                        if line: 
-                            # Only add non-empty lines to body
-                            if entry["Body"]:
-                                entry["Body"] += "\n"
-                            entry["Body"] += line
+    output_file_path = backup_file_path("Backup")
 
-            # If we have a valid entry
-            if entry:
-                # Clean up leading/trailing spaces in title and body for the last entry
-                if "Title" in entry:
-                    entry["Title"] = entry["Title"].strip()
-                    entry["Body"] = entry["Body"].strip()
-                    organized_entries.append(entry)
-            # Loop through the entries, and create a journal .txt for each
-            for entry in organized_entries:
-                try:
-                    # FIX HERE
-                    year, month, day = date_formatter(entry['Date'], False, False).split('-')
-                    formatted_title = str(entry['Title']).lower().replace(' ', '_')[0:25]
-                    if year == 'DirtyEntry' or month == 'DirtyEntry' or day == 'DirtyEntry':
-                        print(f"Invalid Entry :{entry['Title']}")
-                    else:
-                        log("Creating the dream: ", entry['Title'])
-                        #create_dream(year, month, day, formatted_title, entry['Title'], entry['Body'], False)
-                except Exception as e:
-                    print(e)
+    # Writing the whole backup through a single handle
+    with open_backup(output_file_path, 'w') as output_file:
+        output_file.write("==============================\n")
 
-    except Exception as e:
-        print(f"Error? {e}")
+        # Checking if we have any dreams
+        if not dream_entries:
+            print(f"\n{Color.YELLOW}No Dream Entries Found{Color.END}\n")
+        else:
+            for entry in dream_entries:
+                log("Backing Up File", entry.path)
+                write_backup_entry(output_file, entry)
 
-    # Log the total files created
-    log("Sync.txt Was Loaded! Files Created", files_created_count)
+    # Any deltas after this point will be based on this backup
+    manifest = load_manifest() or {"entries": {}}
+    save_manifest({
+        "base": os.path.basename(output_file_path),
+        "deltas": [],
+        "entries": manifest_entries(dream_entries, manifest["entries"]),
+    })
 
-    # Display that we were able to sync
-    print(f"\n{Color.GREEN}Syncing Was Completed Successfully!{Color.END}\n")
+    return output_file_path
 
 # [✅]
 def backup():
@@ -1129,41 +4657,8 @@ def backup():
     Backs up the dream journal files and sends the backup via email.
     '''
 
-    # Let us get all the dream files
-    dream_files = list_files(JOURNAL_DIRECTORY)
-
-    timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")  # Adjusted timestamp format
-    backup_file_name = f"[{timestamp}]_Dream_Backup.txt"
-    output_file_path = os.path.join(BACKUP_DIRECTORY, backup_file_name)
-
-    with open(output_file_path, 'a') as output_file:
-        output_file.write("==============================\n")
+    output_file_path = write_full_backup()
 
-    # Checking if we have any dreams
-    if not dream_files:
-        print(f"\n{Color.YELLOW}No Dream Entries Found{Color.END}\n")
-    else:
-        for file_path in dream_files:
-            log("Backing Up File", file_path)
-
-            with open(file_path, 'r') as file:
-                lines = file.readlines()
-                for i, line in enumerate(lines):
-                    if line.startswith("[ ("):
-                        match = re.search(r'\[ \((.*?)\) \| \((.*?)\) \]', line)
-                        if match:
-                            title = match.group(1)
-                            date_str = match.group(2)
-                            formatted_output = f"[ ({title}) | ({date_str}) ]\n"
-
-                            # Join all lines except the last one in rest_of_content
-                            rest_of_content = ''.join(lines[i + 1:])
-
-                            full_output = formatted_output + rest_of_content
-
-                            with open(output_file_path, 'a') as output_file:
-                                output_file.write(full_output)
-                                output_file.write("\n==============================\n")
     while True:
         # Ask the user if they want to recieve an email
         ask_to_send = input("Do you want to export this backup file? (y | n): ")
@@ -1181,6 +4676,345 @@ def backup():
     else:
         print(f"\n{Color.RED}No backup file was created.{Color.END}\n")
 
+# [✅]
+def incremental_backup():
+    '''
+    Backs up only the entries that were added, changed, or deleted since
+    the last backup, into a delta file that builds on the last full backup.
+    If we've never made a full backup, we'll make one first
+    '''
+
+    manifest = load_manifest()
+    if manifest is None or not os.path.exists(os.path.join(BACKUP_DIRECTORY, manifest["base"])):
+        print(f"\n{Color.YELLOW}No Base Backup Found, Creating A Full Backup{Color.END}\n")
+        output_file_path = write_full_backup()
+        print(f"{Color.GREEN}Backup Created{Color.END}: {output_file_path}\n")
+        return
+
+    dream_entries = list_entries(JOURNAL_DIRECTORY)
+    previous = manifest["entries"]
+    current = manifest_entries(dream_entries, previous)
+
+    # Comparing our hashes with the last backup
+    changed = [entry for entry in dream_entries if entry.path in current and (entry.path not in previous or previous[entry.path]["hash"] != current[entry.path]["hash"])]
+    deleted = [record for file_path, record in previous.items() if file_path not in current]
+
+    if not changed and not deleted:
+        print(f"\n{Color.YELLOW}No Changes Since The Last Backup{Color.END}\n")
+        return
+
+    output_file_path = backup_file_path("Delta")
+
+    with open_backup(output_file_path, 'w') as output_file:
+        output_file.write("==============================\n")
+
+        # Deletions go first, so an entry that was deleted and re-added isn't lost
+        for record in deleted:
+            output_file.write(f"[ ({record['title']}) | {record['date']} ]\n[ Deleted Entry ]\n==============================\n")
+
+        for entry in changed:
+            log("Backing Up File", entry.path)
+            write_backup_entry(output_file, entry)
+
+    manifest["deltas"].append(os.path.basename(output_file_path))
+    manifest["entries"] = current
+    save_manifest(manifest)
+
+    log("Incremental Backup Created", f"{len(changed)} Changed, {len(deleted)} Deleted")
+    print(f"\n{Color.GREEN}Backup Created{Color.END}: {output_file_path}")
+    print(f"{Color.GREEN}Changed{Color.END}: {len(changed)} | {Color.RED}Deleted{Color.END}: {len(deleted)}\n")
+
+# [✅]
+def restore():
+    '''
+    Restores the journal from our last full backup, replaying every
+    delta made after it through sync()
+    '''
+
+    manifest = load_manifest()
+    if manifest is None:
+        print(f"\n{Color.YELLOW}No Backups Found{Color.END}\n")
+        return
+
+    backup_files = [manifest["base"]] + manifest["deltas"]
+
+    while True:
+        ask_to_restore = input(f"Restore {len(backup_files)} backup file(s) into the journal? (y | n): ")
+        if ask_to_restore == 'y':
+            break
+        elif ask_to_restore == 'n':
+            return
+        else:
+            print((f"\n{Color.RED}Unknown Command{Color.END}: [{ask_to_restore}]\n"))
+
+    # Replaying the base, and then every delta in the order they were made
+    for backup_file_name in backup_files:
+        print(f"{Color.BLUE}Restoring{Color.END}: {backup_file_name}")
+        sync(os.path.join(BACKUP_DIRECTORY, backup_file_name))
+
+# [✅]
+def revision_path(digest):
+    """The location of a stored revision, revisions are spread over directories by their first two characters."""
+    return os.path.join(HISTORY_DIRECTORY, digest[:2], digest[2:])
+
+# [✅]
+def read_revision_header(digest):
+    """
+    Reads the header of a stored revision
+
+    Arguments:
+        digest (str): The hash of the revision
+
+    Returns:
+        The revision's depth, the hash of the revision it's compressed against
+        [None if it's stored whole], and the offset its compressed data starts at
+    """
+
+    with open(revision_path(digest), 'rb') as file:
+        header = file.readline()
+
+    magic, depth, parent = header.split()
+    if magic != REVISION_MAGIC:
+        raise ValueError(f"Invalid Revision: {digest}")
+
+    parent = parent.decode()
+    return int(depth), (None if parent == '-' else parent), len(header)
+
+# [✅]
+def load_revision(digest):
+    """
+    Loads the content of a revision, a revision that was compressed against
+    another one needs that one first, so we follow its chain back to the
+    revision that was stored whole, then decompress forwards
+
+    Arguments:
+        digest (str): The hash of the revision
+
+    Returns:
+        The content of the revision as bytes
+    """
+
+    # Every revision in the chain, from ours back to the one stored whole
+    chain = [digest]
+    while True:
+        _, parent, _ = read_revision_header(chain[-1])
+        if parent is None:
+            break
+        chain.append(parent)
+
+    data = b''
+    for link in reversed(chain):
+        _, parent, offset = read_revision_header(link)
+        with open(revision_path(link), 'rb') as file:
+            file.seek(offset)
+            compressed = file.read()
+
+        # The revision before it is the dictionary it was compressed with
+        decompressor = zlib.decompressobj(zdict=data) if parent is not None else zlib.decompressobj()
+        data = decompressor.decompress(compressed) + decompressor.flush()
+
+    # Revisions are named by their hash, so we can tell if one was damaged
+    if hashlib.sha256(data).hexdigest() != digest:
+        raise ValueError(f"Damaged Revision: {digest}")
+
+    return data
+
+# [✅]
+def store_revision(data, parent=None):
+    """
+    Stores a revision, named by the hash of its content, so the same content
+    is only ever stored once, no matter how many entries have it. It's
+    compressed with the revision before it as a dictionary, so unchanged
+    text costs next to nothing, zlib only looks at the last 32 KiB of it
+
+    Arguments:
+        data (bytes): The content of the revision
+        parent (str): The hash of the revision before it, if there is one
+
+    Returns:
+        The hash of the revision
+    """
+
+    digest = hashlib.sha256(data).hexdigest()
+    file_path = revision_path(digest)
+
+    # We already have this content, from this entry or another one
+    if os.path.exists(file_path):
+        return digest
+
+    # Long chains are slow to load, so every so often a revision is stored whole, as is one with a damaged parent
+    depth = 0
+    dictionary = None
+    if parent is not None:
+        try:
+            depth = read_revision_header(parent)[0] + 1
+            if depth <= HISTORY_CHAIN_DEPTH:
+                dictionary = load_revision(parent)
+        except (OSError, ValueError, zlib.error):
+            dictionary = None
+
+    if dictionary is not None:
+        compressor = zlib.compressobj(HISTORY_COMPRESSION_LEVEL, zdict=dictionary)
+    else:
+        parent, depth = None, 0
+        compressor = zlib.compressobj(HISTORY_COMPRESSION_LEVEL)
+    compressed = compressor.compress(data) + compressor.flush()
+
+    # Written through a temporary file, so a revision is never half written
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    temporary_path = file_path + '.tmp'
+    with open(temporary_path, 'wb') as file:
+        file.write(b"%s %d %s\n" % (REVISION_MAGIC, depth, (parent or '-').encode()))
+        file.write(compressed)
+    os.replace(temporary_path, file_path)
+
+    return digest
+
+# The revisions of every entry, {relative path: [(hash, time)]}, and the size of the log they were read from
+_history = None
+_history_size = 0
+
+# [✅]
+def load_history():
+    """
+    Loads the revisions of every entry from the history log, it's only read
+    again if another terminal added to it
+
+    Returns:
+        A dict of {relative path: [(hash, time)]} [Oldest -> Newest]
+    """
+
+    global _history, _history_size
+
+    try:
+        size = os.path.getsize(HISTORY_LOG)
+    except OSError:
+        size = 0
+
+    if _history is None or size != _history_size:
+        _history = {}
+        try:
+            with open(HISTORY_LOG, 'r') as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # A line that was cut off, we skip it
+                    _history.setdefault(record["path"], []).append((record["revision"], record["time"]))
+        except OSError:
+            pass
+        _history_size = size
+
+    return _history
+
+# [✅]
+def entry_revisions(file_path):
+    """
+    The revisions of an entry
+
+    Arguments:
+        file_path (str): The location of the entry
+
+    Returns:
+        A list of (hash, time) [Oldest -> Newest]
+    """
+
+    return load_history().get(os.path.relpath(file_path, JOURNAL_DIRECTORY), [])
+
+# [✅]
+def record_revision(file_path, data):
+    """
+    Records the content of an entry as its newest revision, nothing is
+    recorded if the entry didn't change since its last revision
+
+    Arguments:
+        file_path (str): The location of the entry
+        data (bytes): The content of the entry
+
+    Returns:
+        The hash of the revision
+    """
+
+    global _history, _history_size
+
+    data = bytes(data)
+    history = load_history()
+    relative_path = os.path.relpath(file_path, JOURNAL_DIRECTORY)
+    revisions = history.get(relative_path, [])
+    parent = revisions[-1][0] if revisions else None
+
+    digest = store_revision(data, parent)
+    if digest == parent:
+        return digest
+
+    # The log only ever grows, each line is a single revision
+    record = {"path": relative_path, "revision": digest, "time": time.time()}
+    line = (json.dumps(record) + "\n").encode()
+    os.makedirs(HISTORY_DIRECTORY, exist_ok=True)
+    with open(HISTORY_LOG, 'ab') as file:
+        file.write(line)
+
+    # If another terminal added to the log too, it's read again next time
+    if os.path.getsize(HISTORY_LOG) == _history_size + len(line):
+        history.setdefault(relative_path, []).append((digest, record["time"]))
+        _history_size += len(line)
+    else:
+        _history = None
+
+    return digest
+
+# [✅]
+def diff_revision(data, current):
+    """
+    Compares a revision of an entry with what it is now
+
+    Arguments:
+        data (bytes): The content of the revision
+        current (bytes): The content of the entry
+
+    Returns:
+        The colored unified diff, as a list of lines
+    """
+
+    old_lines = bytes(data).decode('utf-8', 'replace').splitlines()
+    new_lines = bytes(current).decode('utf-8', 'replace').splitlines()
+
+    lines = []
+    for line in difflib.unified_diff(old_lines, new_lines, "Revision", "Current", lineterm=''):
+        if line.startswith('+') and not line.startswith('+++'):
+            lines.append(f"{Color.GREEN}{line}{Color.END}")
+        elif line.startswith('-') and not line.startswith('---'):
+            lines.append(f"{Color.RED}{line}{Color.END}")
+        elif line.startswith('@@'):
+            lines.append(f"{Color.BLUE}{line}{Color.END}")
+        else:
+            lines.append(line)
+
+    return lines
+
+# [✅]
+def restore_revision(file_path, digest):
+    """
+    Restores an entry to one of its revisions, what it was before is
+    recorded first, so restoring can be undone too
+
+    Arguments:
+        file_path (str): The location of the entry
+        digest (str): The hash of the revision
+    """
+
+    data = load_revision(digest)
+
+    record_revision(file_path, read_entry(file_path))
+    write_entry(file_path, data)
+    record_revision(file_path, data)
+
+    # Updating our index and statistics with the restored entry, and dropping its old frames
+    get_entry(file_path)
+    FRAME_CACHE.invalidate(file_path)
+
+    log("Restored Revision", f"{file_path} @ {digest}")
+
 # [✅]
 def send_email(file_path):
     '''
@@ -1222,14 +5056,6 @@ def send_email(file_path):
     except Exception as e:
         print(f'\n{Color.RED}Failed to send email: {e}{Color.END}\n')
 
-# [✅]
-def color_text(text, color_mapping):
-    """Apply color to text based on mapping."""
-    for keyword, color in color_mapping.items():
-        if keyword in text:
-            text = text.replace(keyword, color + keyword + Color.END)
-    return text
-
 # [✅]
 def statistics():
     '''
@@ -1241,70 +5067,26 @@ def statistics():
         - Sleep Cycles: {sleep_cycles}
     '''
 
-    dream_type_count = Counter()
-    technique_count = Counter()
-    sleep_cycle_count = Counter()
-
-    dream_files = list_files(JOURNAL_DIRECTORY)
+    # Our statistics are kept up to date by the index, or counted by the database, we don't need to open any entries
+    store = entry_store()
+    if isinstance(store, DatabaseStore):
+        num_dream_journals, counts = store.statistics(JOURNAL_DIRECTORY)
+    else:
+        index = load_index(JOURNAL_DIRECTORY)
+        num_dream_journals, counts = len(index["entries"]), index["statistics"]
 
-    if not dream_files:
+    if not num_dream_journals:
         print(f"\n{Color.YELLOW}No Dream Entries Found{Color.END}\n")
         return  # Early exit since there are no entries to process
 
-    for file_path in dream_files:
-        with open(file_path, 'r') as file:
-            lines = file.readlines()
-
-            for i, line in enumerate(lines):
-                # Color the dream types
-                if i == 2 and "Lucid" in line:
-                    line = line.replace("Lucid", f"{Color.YELLOW}Lucid{Color.END}")
-                if i == 2 and "Vivid" in line:
-                    line = line.replace("Vivid", f"{Color.GREEN}Vivid{Color.END}")
-                if i == 2 and "Nightmare" in line:
-                    line = line.replace("Nightmare", f"{Color.RED}Nightmare{Color.END}")
-                if i == 2 and "Vague" in line:
-                    line = line.replace("Vague", f"{Color.BROWN}Vague{Color.END}")
-                if i == 2 and "Vivimax" in line:
-                    line = line.replace("Vivimax", f"{Color.TRUE_HOT_PINK}Vivimax{Color.END}")
-
-                # Color the dream techniques
-                if i == 3 and "WILD" in line:
-                    line = line.replace("WILD", f"{Color.BLUE}WILD{Color.END}")
-                if i == 3 and "MILD" in line:
-                    line = line.replace("MILD", f"{Color.RED}MILD{Color.END}")
-                if i == 3 and "SSILD" in line:
-                    line = line.replace("SSILD", f"{Color.CYAN}SSILD{Color.END}")
-                if i == 3 and "DILD" in line:
-                    line = line.replace("DILD", f"{Color.YELLOW}DILD{Color.END}")
-                if i == 3 and "ADA" in line:
-                    line = line.replace("ADA", f"{Color.TRUE_HOT_PINK}ADA{Color.END}")
-
-                # Color the sleep cycles
-                if i == 4 and "Regular" in line:
-                    line = line.replace("Regular", f"{Color.GRAY}Regular{Color.END}")
-                if i == 4 and "WBTB" in line:
-                    line = line.replace("WBTB", f"{Color.MAGENTA}WBTB{Color.END}")
-                if i == 4 and "Nap" in line:
-                    line = line.replace("Nap", f"{Color.CYAN}Nap{Color.END}")
-
-                # Update counters
-                if i == 2:
-                    dream_types = line.split("Dream Type:")[1].strip().split(", ")
-                    dream_type_count.update(dream_types)
-                elif i == 3:
-                    techniques = line.split("Technique:")[1].strip().split(", ")
-                    technique_count.update(techniques)
-                elif i == 4:
-                    sleep_cycles = line.split("Sleep Cycle:")[1].strip().split(", ")
-                    sleep_cycle_count.update(sleep_cycles)
-
-    # Prepare statistics output
-    num_dream_journals = len(dream_files)
-
-    dream_types_output = "\n".join([f"{dt}: {count}" for dt, count in sorted(dream_type_count.items())])
-    techniques_output = "\n".join([f"{tech}: {count}" for tech, count in sorted(technique_count.items())])
-    sleep_cycles_output = "\n".join([f"{sc}: {count}" for sc, count in sorted(sleep_cycle_count.items())])
+    dream_type_count = counts["dream_type"]
+    technique_count = counts["technique"]
+    sleep_cycle_count = counts["sleep_cycle"]
+
+    # Coloring our categories, the same way they're displayed inside an entry
+    dream_types_output = "\n".join([f"{RENDERER.color_field('dream_type', dt)}: {count}" for dt, count in sorted(dream_type_count.items())])
+    techniques_output = "\n".join([f"{RENDERER.color_field('technique', tech)}: {count}" for tech, count in sorted(technique_count.items())])
+    sleep_cycles_output = "\n".join([f"{RENDERER.color_field('sleep_cycle', sc)}: {count}" for sc, count in sorted(sleep_cycle_count.items())])
 
     statistics_output = (
         f"\n{Color.GREEN}Dream Journals{Color.END}: {num_dream_journals}\n"
@@ -1317,6 +5099,85 @@ def statistics():
     print(statistics_output)
     print("───────────────────────────────────────────────────────────────────────")
 
+# [✅]
+class LogWriter:
+    """
+    Buffers log lines in memory, and writes them to logs.txt together, once
+    enough of them pile up, once they're old enough, or when we exit.
+    When logs.txt grows too large it's rotated, keeping LOG_BACKUP_COUNT old logs
+    """
+
+    def __init__(self):
+        self.buffer = []
+        self.buffered_bytes = 0
+        self.last_flush = time.monotonic()
+        # Sync writes entries on other threads, so the buffer is locked
+        self.lock = threading.Lock()
+
+    def write(self, lines):
+        """Adds formatted lines to the buffer, flushing it if it's full or old."""
+
+        with self.lock:
+            for line in lines:
+                self.buffer.append(line)
+                self.buffered_bytes += len(line)
+
+            if self.buffered_bytes >= LOG_FLUSH_BYTES or time.monotonic() - self.last_flush >= LOG_FLUSH_SECONDS:
+                self.flush_locked()
+
+    def flush(self):
+        """Writes everything inside the buffer to logs.txt."""
+
+        with self.lock:
+            self.flush_locked()
+
+    def discard(self):
+        """Throws away everything inside the buffer, used when the logs are cleared."""
+
+        with self.lock:
+            self.buffer = []
+            self.buffered_bytes = 0
+
+    def flush_locked(self):
+        """Writes the buffer, the lock must already be held."""
+
+        self.last_flush = time.monotonic()
+        if not self.buffer:
+            return
+
+        try:
+            # Rotating the log, if these lines would make it too large
+            if os.path.exists(LOGS_FILE) and os.path.getsize(LOGS_FILE) + self.buffered_bytes > LOG_MAX_BYTES:
+                self.rotate()
+
+            # Opening the logs file, once for the whole buffer
+            with open(LOGS_FILE, 'a') as log:
+                log.writelines(self.buffer)
+
+        # We can't log that logging failed, so just display it
+        except OSError as e:
+            print(f"{Color.RED}Error writing logs: {e}{Color.END}")
+
+        self.buffer = []
+        self.buffered_bytes = 0
+
+    @staticmethod
+    def rotate():
+        """Moves logs.txt to logs.txt.1, logs.txt.1 to logs.txt.2, and so on."""
+
+        for number in range(LOG_BACKUP_COUNT, 0, -1):
+            source = LOGS_FILE if number == 1 else f"{LOGS_FILE}.{number - 1}"
+            if os.path.exists(source):
+                os.replace(source, f"{LOGS_FILE}.{number}")
+
+        # Without any backups, we just start over
+        if LOG_BACKUP_COUNT <= 0 and os.path.exists(LOGS_FILE):
+            os.remove(LOGS_FILE)
+
+# Every log goes through this writer, and whatever is left is written when we exit
+LOG_WRITER = LogWriter()
+atexit.register(LOG_WRITER.flush)
+
 # [✅]
 def log(event, details):
     '''
@@ -1325,21 +5186,234 @@ def log(event, details):
 
     # Getting the formatted date
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    # Opening the logs file
-    with open(LOGS_FILE, 'a') as log:
-        # Writing to our file in a formatted manner
-        log.write(f"\n[{timestamp}] | {event}: {details}\n")
+    # Writing to our logs in a formatted manner
+    LOG_WRITER.write([f"\n[{timestamp}] | {event}: {details}\n"])
+
+# [✅]
+def log_many(event, details):
+    '''
+    A function to create a log event for many details at once
+    '''
+
+    # Getting the formatted date
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Writing to our logs in a formatted manner
+    LOG_WRITER.write([f"\n[{timestamp}] | {event}: {detail}\n" for detail in details])
+
+# [✅]
+def update_log_index():
+    """
+    Brings the sparse log index up to date. The index stores the timestamp
+    and offset of a log line every LOG_INDEX_INTERVAL bytes, since the log is
+    append only, we only ever read the part written since the last update.
+    If logs.txt was cleared or rotated, the index is built again
+
+    Returns:
+        A list of [timestamp, offset], in the order of the log
+    """
+
+    # The start of logs.txt, used to tell if it was replaced since we indexed it
+    with open(LOGS_FILE, 'rb') as file:
+        head = file.read(64).decode('latin-1')
+        size = file.seek(0, os.SEEK_END)
+
+    index = {"head": head, "size": 0, "points": []}
+    try:
+        with open(LOG_INDEX_FILE, 'r') as file:
+            stored = json.load(file)
+        if stored["head"] == head[:len(stored["head"])] and stored["size"] <= size:
+            index = stored
+    except (OSError, ValueError, KeyError):
+        pass
+
+    # Nothing new was logged since our last update
+    if index["size"] == size and index["head"] == head:
+        return index["points"]
+
+    points = index["points"]
+    last_offset = points[-1][1] if points else -LOG_INDEX_INTERVAL
+
+    # Reading only what was logged after our last update
+    with open(LOGS_FILE, 'rb') as file:
+        offset = file.seek(index["size"])
+        for line in file:
+            if offset - last_offset >= LOG_INDEX_INTERVAL:
+                match = LOG_LINE_PATTERN.match(line.decode('utf-8', 'replace'))
+                if match:
+                    points.append([match.group(1), offset])
+                    last_offset = offset
+            offset += len(line)
+
+    index.update({"head": head, "size": offset, "points": points})
+
+    try:
+        with open(LOG_INDEX_FILE, 'w') as file:
+            json.dump(index, file, separators=(',', ':'))
+    except OSError as e:
+        print(f"{Color.RED}Error saving the log index: {e}{Color.END}")
+
+    return points
+
+# [✅]
+def log_matches(line, event, start, end):
+    """
+    Checks if a log line matches a query
+
+    Arguments:
+        line (str): The log line
+        event (str): Text the event must contain, or None for every event
+        start (str): The earliest timestamp, or None
+        end (str): The latest timestamp, or None
+
+    Returns:
+        True if the line matches
+    """
+
+    match = LOG_LINE_PATTERN.match(line)
+    if not match:
+        return False
+
+    timestamp = match.group(1)
+    if (start and timestamp < start) or (end and timestamp > end):
+        return False
+
+    return not event or event.lower() in match.group(2).lower()
+
+# [✅]
+def query_logs(event=None, start=None, end=None):
+    """
+    Streams the log lines that match a query, the index lets us jump
+    straight to the start of the time range instead of reading the whole log
+
+    Arguments:
+        event (str): Text the event must contain, or None for every event
+        start (str): The earliest timestamp [YYYY-MM-DD HH:MM:SS], or None
+        end (str): The latest timestamp [YYYY-MM-DD HH:MM:SS], or None
+
+    Yields:
+        Every matching log line
+    """
+
+    offset = 0
+    if start:
+        # Finding the last indexed line before our range starts
+        points = update_log_index()
+        position = bisect.bisect_left([timestamp for timestamp, _ in points], start) - 1
+        if position >= 0:
+            offset = points[position][1]
+
+    with open(LOGS_FILE, 'r', errors='replace') as file:
+        file.seek(offset)
+        for line in file:
+            match = LOG_LINE_PATTERN.match(line)
+
+            # The log is in order, so we can stop once we're past our range
+            if match and end and match.group(1) > end:
+                break
+
+            if log_matches(line, event, start, end):
+                yield line.rstrip('\n')
+
+# [✅]
+def tail_logs(count, event=None, start=None, end=None):
+    """
+    Finds the last matching log lines, reading logs.txt backwards from its end
+
+    Arguments:
+        count (int): How many lines we want
+        event (str): Text the event must contain, or None for every event
+        start (str): The earliest timestamp, or None
+        end (str): The latest timestamp, or None
+
+    Returns:
+        The matching lines, oldest first
+    """
+
+    lines = []
+    remainder = b''
+
+    with open(LOGS_FILE, 'rb') as file:
+        position = file.seek(0, os.SEEK_END)
+
+        while position > 0 and len(lines) < count:
+            size = min(LOG_TAIL_CHUNK, position)
+            position -= size
+            file.seek(position)
+
+            # The first line of our chunk may be cut off, so we keep it for the next chunk
+            chunk = file.read(size) + remainder
+            parts = chunk.split(b'\n')
+            remainder = parts.pop(0) if position > 0 else b''
+
+            for part in reversed(parts):
+                line = part.decode('utf-8', 'replace')
+                if log_matches(line, event, start, end):
+                    lines.append(line)
+                    if len(lines) == count:
+                        break
+
+        if len(lines) < count and remainder:
+            line = remainder.decode('utf-8', 'replace')
+            if log_matches(line, event, start, end):
+                lines.append(line)
+
+    return lines[::-1]
+
+# [✅]
+def parse_log_time(text, end):
+    """
+    Turns a user entered date into a log timestamp
+
+    Arguments:
+        text (str): A date [YYYY-MM-DD] or a time [YYYY-MM-DD HH:MM:SS]
+        end (bool): If this is the end of a range, a date then includes the whole day
+
+    Returns:
+        The timestamp, or None if the text is empty
+    """
+
+    if not text:
+        return None
+
+    for time_format, padding in (("%Y-%m-%d %H:%M:%S", ""), ("%Y-%m-%d %H:%M", ":59"), ("%Y-%m-%d", " 23:59:59")):
+        try:
+            datetime.strptime(text, time_format)
+            return text + padding if end else text
+        except ValueError:
+            pass
+
+    raise ValueError(f"Invalid Date: {text}")
 
 # [✅]
 def get_logs():
     '''
-    A function that prints the logs to screen
+    A function that prints the logs to screen, they can be filtered by
+    event type and time range, or limited to the last few events
     '''
 
     print(f"\n{Color.GREEN}Getting Logs{Color.END}")
-    with open(LOGS_FILE, 'r') as file:
-        content = file.read()
-        print(content)
+
+    # Making sure the logs still inside our buffer are shown
+    LOG_WRITER.flush()
+
+    event = input("Event type, eg. 'Created Dream @' (blank for all): ").strip()
+    try:
+        start = parse_log_time(input("From [YYYY-MM-DD (HH:MM:SS)] (blank for the start): ").strip(), False)
+        end = parse_log_time(input("To [YYYY-MM-DD (HH:MM:SS)] (blank for now): ").strip(), True)
+        count = input("Show the last N events (blank for all): ").strip()
+        count = int(count) if count else None
+    except ValueError as e:
+        print(f"\n{Color.RED}{e}{Color.END}\n")
+        return
+
+    print()
+    if count is not None:
+        for line in tail_logs(count, event, start, end):
+            print(line)
+    else:
+        for line in query_logs(event, start, end):
+            print(line)
+    print()
 
 # [✅]
 def clear_logs():
@@ -1349,6 +5423,9 @@ def clear_logs():
 
     print(f"\n{Color.GREEN}Clearing Logs{Color.END}\n")
     try:
+        # The logs that haven't been written yet are cleared too
+        LOG_WRITER.discard()
+
         with open(LOGS_FILE, 'w') as f:
             f.truncate(0)  # Truncate the file to size 0
         print(f"{Color.GREEN}Successfully cleared the logs file: {LOGS_FILE}{Color.END}\n")
@@ -1386,8 +5463,14 @@ def display_help():
     print(f"'{Color.GREEN}navigate{Color.END}'     - View yur dream entries")
     print(f"'{Color.GREEN}stats{Color.END}'        - View your dream statistics\n")
     print(f"'{Color.GREEN}backup{Color.END}'       - Back up all exisiting dreams to a (.txt)")
-    print(f"'{Color.GREEN}sync{Color.END}'         - Sync all your dreams from a backup file (.txt)\n")
-    print(f"'{Color.GREEN}logs{Color.END}'         - Check the programs logs\n")
+    print(f"'{Color.GREEN}backup_inc{Color.END}'   - Back up only the dreams changed since the last backup")
+    print(f"'{Color.GREEN}sync{Color.END}'         - Sync all your dreams from a backup file (.txt)")
+    print(f"'{Color.GREEN}restore{Color.END}'      - Restore your dreams from the last backup and its changes")
+    print(f"'{Color.GREEN}pack{Color.END}'         - Copy your dreams into a single packed journal (.pack)")
+    print(f"'{Color.GREEN}unpack{Color.END}'       - Export your packed journal back to (.txt) files")
+    print(f"'{Color.GREEN}db_import{Color.END}'    - Copy your dreams into an SQLite database (.db)")
+    print(f"'{Color.GREEN}db_export{Color.END}'    - Export your database back to (.txt) files\n")
+    print(f"'{Color.GREEN}logs{Color.END}'         - Check the programs logs, by event, time, or the last N\n")
     print(f"'{Color.GREEN}clr_logs{Color.END}'     - Clear the programs logs")
     print(f"'{Color.GREEN}toggle_del{Color.END}'   - Toggle dream deletion, currently: {CAN_DELETE}\n")
     print(f"'{Color.GREEN}clear{Color.END}'        - Clear the terminal")
@@ -1396,11 +5479,13 @@ def display_help():
 # [✅]
 def clear_terminal():
     ''' 
-    A function that clears the terminal using 'clear' command
+    A function that clears the terminal, along with its scrollback, using
+    escape sequences, so we don't start a 'clear' process every time
     '''
 
-    os.system('cls' if os.name == 'nt' else 'clear')
+    sys.stdout.write("\x1b[H\x1b[2J\x1b[3J")
     print(PROGRAM_NAME)
+    SCREEN.invalidate()
 
 # [✅]
 def handle_commands(input_command):
@@ -1415,6 +5500,12 @@ def handle_commands(input_command):
 
         "sync": sync,
         "backup": backup,
+        "backup_inc": incremental_backup,
+        "restore": restore,
+        "pack": pack_journal,
+        "unpack": unpack_journal,
+        "db_import": database_import,
+        "db_export": database_export,
 
         "logs": get_logs,
         "clr_logs": clear_logs,
@@ -1431,6 +5522,9 @@ def handle_commands(input_command):
     command_func = commands.get(input_command)
     if command_func:
         command_func()
+
+        # Saving any changes the command made to our index
+        flush_index()
     else:
         print(f"\n{Color.RED}Unknown Command{Color.END}: [{input_command}] | Type 'help' for a list of commands.\n")
 
@@ -1442,6 +5536,10 @@ def main():
     '''
 
     clear_terminal() 
+
+    # Reconciling our index with any entries that changed while we were closed
+    refresh_index(JOURNAL_DIRECTORY)
+
     while True:
         user_command = input("Enter a command (type 'help' for commands): ").strip().lower()
         handle_commands(user_command)
@@ -1475,6 +5573,8 @@ def loader():
 if __name__ == "__main__":
     loaded = loader()
     if loaded:
+        # Making sure the index is saved however we exit
+        atexit.register(flush_index)
         main()
     else:
         print(f"\n{Color.RED}Invalid Directories!\n1. Go Inside dream-journal/src/journal.py\n2. Go To The Top Of The File\n3. Swap Directory Variables With Valid Directories\n4. Rerun Program{Color.END}")
\ No newline at end of file